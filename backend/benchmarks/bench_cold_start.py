@@ -0,0 +1,87 @@
+"""Cold start of one worker: interpreter launch -> import app -> create_app() -> first response.
+
+Each run starts a fresh Python process, as a forking or pre-spawning server
+does for every worker, and reports the median and worst time of each phase.
+--create-all adds the db.create_all() that app.py used to run on import, to
+compare against the previous startup path.
+
+Run from backend/:
+    python benchmarks/bench_cold_start.py --runs 10 --database-url sqlite:////tmp/medico.db
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+BACKEND = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+# Runs inside the worker process as `-c CHILD path create_all`; prints
+# wall-clock timestamps of each phase as JSON
+CHILD = '''
+import json, sys, time
+marks = {'started': time.time()}
+path, create_all = sys.argv[1], sys.argv[2] == '1'
+from app import create_app
+marks['imported'] = time.time()
+app = create_app()
+if create_all:
+    from models import db
+    with app.app_context():
+        db.create_all()
+marks['created'] = time.time()
+response = app.test_client().get(path)
+marks['responded'] = time.time()
+marks['status'] = response.status_code
+print(json.dumps(marks))
+'''
+
+
+def run_once(path, create_all, env):
+    launched = time.time()
+    output = subprocess.run(
+        [sys.executable, '-c', CHILD, path, '1' if create_all else '0'],
+        cwd=BACKEND, env=env, capture_output=True, text=True, check=True
+    ).stdout
+    marks = json.loads(output.strip().splitlines()[-1])
+    return {
+        'interpreter': marks['started'] - launched,
+        'import': marks['imported'] - marks['started'],
+        'create_app': marks['created'] - marks['imported'],
+        'first_request': marks['responded'] - marks['created'],
+        'total': marks['responded'] - launched,
+        'status': marks['status'],
+    }
+
+
+def summarize(runs):
+    report = {}
+    for phase in ('interpreter', 'import', 'create_app', 'first_request', 'total'):
+        values = [run[phase] * 1000 for run in runs]
+        report[phase] = {'median_ms': round(statistics.median(values), 1), 'max_ms': round(max(values), 1)}
+    report['statuses'] = sorted({run['status'] for run in runs})
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=10)
+    parser.add_argument('--path', default='/', help='Path of the first request.')
+    parser.add_argument('--database-url', help='Overrides DATABASE_URL for the workers.')
+    parser.add_argument('--create-all', action='store_true',
+                        help='Also run db.create_all() during startup, like the old import-time code.')
+    args = parser.parse_args()
+
+    env = dict(os.environ)
+    if args.database_url:
+        env['DATABASE_URL'] = args.database_url
+    runs = [run_once(args.path, args.create_all, env) for _ in range(args.runs)]
+    report = summarize(runs)
+    report.update(runs=args.runs, create_all=args.create_all)
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,105 @@
+"""Effect of a login burst on the latency of other endpoints.
+
+Measures p50/p95/p99 of a cheap probe request (default GET /) on its own and
+while N threads log in concurrently, plus the login throughput reached.
+Run against a running server, e.g. with PASSWORD_HASH_WORKERS=0 and then 2:
+
+    python benchmarks/bench_login_burst.py --url http://127.0.0.1:5000 \\
+        --username doctor --password secret --login-threads 16 --duration 10
+"""
+import argparse
+import json
+import threading
+import time
+import urllib.error
+import urllib.request
+
+
+def percentile(values, pct):
+    if not values:
+        return float('nan')
+    values = sorted(values)
+    index = min(len(values) - 1, int(round(pct / 100 * (len(values) - 1))))
+    return values[index]
+
+
+def timed_request(url, data=None):
+    body = json.dumps(data).encode() if data is not None else None
+    req = urllib.request.Request(url, data=body, headers={'Content-Type': 'application/json'})
+    start = time.perf_counter()
+    try:
+        with urllib.request.urlopen(req, timeout=30) as resp:
+            resp.read()
+            status = resp.status
+    except urllib.error.HTTPError as e:
+        status = e.code
+    return time.perf_counter() - start, status
+
+
+def probe(url, stop, latencies):
+    while not stop.is_set():
+        elapsed, _ = timed_request(url)
+        latencies.append(elapsed)
+
+
+def login_loop(url, credentials, stop, results):
+    while not stop.is_set():
+        elapsed, status = timed_request(url, credentials)
+        results.append((elapsed, status))
+
+
+def run_phase(args, with_logins):
+    stop = threading.Event()
+    probe_latencies, logins = [], []
+    threads = [threading.Thread(target=probe, args=(args.url + args.probe_path, stop, probe_latencies))]
+    if with_logins:
+        credentials = {'username': args.username, 'password': args.password}
+        threads += [
+            threading.Thread(target=login_loop, args=(args.url + '/api/login', credentials, stop, logins))
+            for _ in range(args.login_threads)
+        ]
+    for t in threads:
+        t.start()
+    time.sleep(args.duration)
+    stop.set()
+    for t in threads:
+        t.join()
+
+    def ms(value):
+        return round(value * 1000, 2)
+
+    result = {
+        'probe_requests': len(probe_latencies),
+        'probe_p50_ms': ms(percentile(probe_latencies, 50)),
+        'probe_p95_ms': ms(percentile(probe_latencies, 95)),
+        'probe_p99_ms': ms(percentile(probe_latencies, 99)),
+    }
+    if with_logins:
+        ok = [elapsed for elapsed, status in logins if status == 200]
+        result.update({
+            'logins_per_s': round(len(ok) / args.duration, 2),
+            'login_p99_ms': ms(percentile(ok, 99)),
+            'login_503s': sum(1 for _, status in logins if status == 503),
+        })
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--url', default='http://127.0.0.1:5000')
+    parser.add_argument('--username', required=True)
+    parser.add_argument('--password', required=True)
+    parser.add_argument('--probe-path', default='/')
+    parser.add_argument('--login-threads', type=int, default=16)
+    parser.add_argument('--duration', type=float, default=10.0)
+    args = parser.parse_args()
+
+    report = {
+        'baseline': run_phase(args, with_logins=False),
+        'during_login_burst': run_phase(args, with_logins=True),
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == '__main__':
+    main()
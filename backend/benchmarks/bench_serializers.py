@@ -0,0 +1,69 @@
+"""Throughput of serializing a 10k-row patient list: hand-built dicts + stdlib json
+(the previous get_patients code path) versus the compiled serializer + fast encoder.
+
+Run from backend/:  python benchmarks/bench_serializers.py [rows] [repeat]
+"""
+import os
+import sys
+import json
+import time
+from datetime import date
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from models import Patient  # noqa: E402
+from serializers import patient_serializer, orjson  # noqa: E402
+
+
+def make_patients(n):
+    return [Patient(
+        id=i, first_name=f'First{i}', last_name=f'Last{i}', email=f'patient{i}@example.com',
+        age=30 + i % 50, birth_date=date(1950 + i % 60, 1 + i % 12, 1 + i % 28),
+        home_address=f'{i} Main Street', home_phone='555-0100', personal_phone='555-0199',
+        occupation='Engineer', medical_insurance='ACME Health'
+    ) for i in range(n)]
+
+
+def handwritten(patients):
+    return json.dumps([{
+        'id': p.id,
+        'first_name': p.first_name,
+        'last_name': p.last_name,
+        'email': p.email,
+        'age': p.age,
+        'birth_date': p.birth_date.isoformat() if p.birth_date else None,
+        'home_address': p.home_address,
+        'home_phone': p.home_phone,
+        'personal_phone': p.personal_phone,
+        'occupation': p.occupation,
+        'medical_insurance': p.medical_insurance
+    } for p in patients])
+
+
+def compiled(patients, fields=None):
+    rows = patient_serializer.dump_many(patients, fields)
+    return orjson.dumps(rows) if orjson is not None else json.dumps(rows)
+
+
+def bench(label, fn, patients, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(patients)
+        best = min(best, time.perf_counter() - start)
+    print(f'{label:40} {best * 1000:8.2f} ms  {len(patients) / best:12,.0f} rows/s')
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    patients = make_patients(rows)
+    print(f'{rows} patients, best of {repeat}, encoder: {"orjson" if orjson else "stdlib json"}')
+    bench('before: hand-built dicts + json', handwritten, patients, repeat)
+    bench('after: compiled serializer', compiled, patients, repeat)
+    bench('after: ?fields=id,first_name,last_name',
+          lambda ps: compiled(ps, ('id', 'first_name', 'last_name')), patients, repeat)
+
+
+if __name__ == '__main__':
+    main()
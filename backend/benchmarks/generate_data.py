@@ -0,0 +1,281 @@
+"""Seeded synthetic clinic data for benchmarks: users, patients, appointments, records and messages.
+
+The same --seed and sizes always produce the same rows, so runs against
+different code are comparable. Rows go in with batched executemany inserts,
+which keeps a million-patient load to minutes. A JSON manifest describing the
+dataset (users, password, date window, id ranges) is written for the load driver.
+
+Run from backend/:
+    python benchmarks/generate_data.py --database-url sqlite:////tmp/medico-bench.db \\
+        --patients 10000 --manifest /tmp/medico-bench.json --drop
+    python benchmarks/generate_data.py --database-url postgresql://postgres@localhost/medico_bench \\
+        --patients 1000000 --doctors 600 --days 730 --messages 2000000 --manifest bench.json --drop
+
+Each doctor has about 4,160 appointment slots per 365 days, so --doctors
+times --days must leave room for --patients times --appointments-per-patient.
+"""
+import argparse
+import bisect
+import json
+import os
+import random
+import sys
+import time
+from datetime import date, datetime, time as clock_time, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from app import create_app  # noqa: E402
+from models import db, User, Patient, Appointment, PatientRecord, Message, NOTES_EXCERPT_LENGTH  # noqa: E402
+from column_types import make_excerpt  # noqa: E402
+from passwords import password_hasher  # noqa: E402
+from scheduling import working_hours, slot_minutes  # noqa: E402
+
+FIRST_NAMES = ['Ana', 'Luis', 'Maria', 'Jose', 'Carmen', 'Juan', 'Elena', 'Pedro', 'Lucia', 'Diego',
+               'Sofia', 'Miguel', 'Laura', 'Pablo', 'Marta', 'Jorge', 'Paula', 'Andres', 'Clara', 'Raul']
+LAST_NAMES = ['Garcia', 'Rodriguez', 'Martinez', 'Lopez', 'Sanchez', 'Perez', 'Gomez', 'Martin', 'Jimenez',
+              'Ruiz', 'Hernandez', 'Diaz', 'Moreno', 'Alvarez', 'Romero', 'Navarro', 'Torres', 'Ramos',
+              'Castro', 'Ortega', 'Rubio', 'Molina', 'Delgado', 'Soriano', 'Morales', 'Ortiz', 'Vega']
+OCCUPATIONS = ['Teacher', 'Engineer', 'Nurse', 'Driver', 'Retired', 'Student', 'Accountant', 'Chef', None]
+INSURERS = ['ACME Health', 'Salud Total', 'MediCare Plus', 'Vida Segura', None]
+DIAGNOSES = ['Hypertension', 'Type 2 diabetes', 'Seasonal allergy', 'Lower back pain', 'Migraine',
+             'Bronchitis', 'Gastritis', 'Anxiety', None]
+PRESCRIPTIONS = ['Ibuprofen 400mg', 'Metformin 850mg', 'Loratadine 10mg', 'Omeprazole 20mg',
+                 'Amoxicillin 500mg', 'Enalapril 10mg', None]
+WORDS = ('patient reports improvement since last visit blood pressure stable follow up in two weeks '
+         'mild pain on exertion no fever advised rest and hydration labs requested review results '
+         'continue current treatment adjust dose if symptoms persist referral to specialist').split()
+MESSAGES = ['Can you confirm the 10:00 appointment?', 'Patient is in the waiting room.',
+            'Lab results are in.', 'Please call back the family.', 'Rescheduled to next week.',
+            'Running 15 minutes late.', 'Prescription ready for signature.', 'Thanks!']
+
+
+def progress(label, done, total, started):
+    rate = done / max(time.perf_counter() - started, 1e-9)
+    print(f'\r{label}: {done}/{total} ({rate:,.0f} rows/s)', end='', file=sys.stderr, flush=True)
+
+
+def insert_batches(label, table, rows, total, batch_size):
+    started = time.perf_counter()
+    batch, done = [], 0
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= batch_size:
+            db.session.execute(table.insert(), batch)
+            db.session.commit()
+            done += len(batch)
+            batch = []
+            progress(label, done, total, started)
+    if batch:
+        db.session.execute(table.insert(), batch)
+        db.session.commit()
+        done += len(batch)
+    progress(label, done, total, started)
+    print(file=sys.stderr)
+
+
+def notes(rng):
+    return ' '.join(rng.choice(WORDS) for _ in range(rng.randint(8, 120))).capitalize() + '.'
+
+
+def generate_users(args, password_hash):
+    users = [{'username': f'dr_{i:03d}', 'role': 'doctor'} for i in range(args.doctors)]
+    users += [{'username': f'desk_{i:03d}', 'role': 'secretary'} for i in range(args.secretaries)]
+    for user in users:
+        user['password_hash'] = password_hash
+    return users
+
+
+def generate_patients(args, rng):
+    for n in range(1, args.patients + 1):
+        birth_date = date(1930, 1, 1) + timedelta(days=rng.randint(0, 33000))
+        yield {
+            'first_name': rng.choice(FIRST_NAMES),
+            'last_name': rng.choice(LAST_NAMES),
+            'email': f'patient{n}@example.com',
+            'age': (date.today() - birth_date).days // 365,
+            'birth_date': birth_date,
+            'home_address': f'{rng.randint(1, 999)} Calle {rng.choice(LAST_NAMES)}',
+            'home_phone': f'555-{rng.randint(0, 9999):04d}',
+            'personal_phone': f'600-{rng.randint(0, 999999):06d}',
+            'occupation': rng.choice(OCCUPATIONS),
+            'medical_insurance': rng.choice(INSURERS),
+        }
+
+
+class AppointmentSlots:
+    """Every (doctor, day, start minute) inside working hours, addressable by index.
+
+    Slots are grouped in one block per doctor and day, so millions of slots
+    cost one small list per block rather than one tuple each.
+    """
+
+    def __init__(self, doctors, first_day, last_day):
+        length = slot_minutes()
+        self.blocks = []   # (doctor, day, [start minutes])
+        self.offsets = []  # index of each block's first slot
+        self.total = 0
+        day = first_day
+        while day <= last_day:
+            for doctor in doctors:
+                minutes = [minute for begin, end in working_hours(doctor, day)
+                           for minute in range(begin, end - length + 1, length)]
+                if minutes:
+                    self.blocks.append((doctor, day, minutes))
+                    self.offsets.append(self.total)
+                    self.total += len(minutes)
+            day += timedelta(days=1)
+
+    def __getitem__(self, index):
+        block = bisect.bisect_right(self.offsets, index) - 1
+        doctor, day, minutes = self.blocks[block]
+        return doctor, day, minutes[index - self.offsets[block]]
+
+
+def generate_appointments(args, rng, slots, total):
+    # Distinct slots, so the data never contains a double booking
+    for index in sorted(rng.sample(range(slots.total), total)):
+        doctor, day, minute = slots[index]
+        yield {
+            'patient_id': rng.randint(1, args.patients),
+            'appointment_date': day,
+            'appointment_time': clock_time(minute // 60, minute % 60),
+            'doctor': doctor,
+        }
+
+
+def generate_records(args, rng, doctors, total):
+    now = datetime.utcnow()
+    for _ in range(total):
+        record_date = now - timedelta(minutes=rng.randint(0, 365 * 24 * 60))
+        edited = rng.random() < 0.2
+        doctor = rng.choice(doctors)
+        text = notes(rng)
+        yield {
+            'patient_id': rng.randint(1, args.patients),
+            'doctor': doctor,
+            'notes': text,
+            'notes_excerpt': make_excerpt(text, NOTES_EXCERPT_LENGTH),
+            'diagnosis': rng.choice(DIAGNOSES),
+            'prescription': rng.choice(PRESCRIPTIONS),
+            'record_date': record_date,
+            'updated_by': doctor if edited else None,
+            'updated_at': record_date + timedelta(days=rng.randint(0, 30)) if edited else None,
+        }
+
+
+def generate_messages(args, rng, doctor_ids, secretary_ids):
+    # Mostly doctor <-> front desk chatter, oldest first so ids follow created_at
+    start = datetime.utcnow() - timedelta(days=30)
+    step = timedelta(days=30) / max(args.messages, 1)
+    everyone = doctor_ids + secretary_ids
+    for n in range(args.messages):
+        if secretary_ids and rng.random() < 0.8:
+            pair = [rng.choice(doctor_ids), rng.choice(secretary_ids)]
+            rng.shuffle(pair)
+            sender, recipient = pair
+        else:
+            sender, recipient = rng.sample(everyone, 2)
+        yield {
+            'sender_id': sender,
+            'recipient_id': recipient,
+            'content': rng.choice(MESSAGES),
+            'created_at': start + step * n,
+            'read': n < args.messages * 0.95,
+        }
+
+
+# Same backfill as the conversation_state migration
+CONVERSATION_STATE_BACKFILL = """
+    INSERT INTO conversation_state (user_id, partner_id, unread_count, last_message_id)
+    SELECT user_id, partner_id, SUM(unread), MAX(id)
+    FROM (
+        SELECT recipient_id AS user_id, sender_id AS partner_id,
+               CASE WHEN read THEN 0 ELSE 1 END AS unread, id
+        FROM message
+        UNION ALL
+        SELECT sender_id, recipient_id, 0, id
+        FROM message
+    ) AS m
+    GROUP BY user_id, partner_id
+"""
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--database-url', required=True)
+    parser.add_argument('--patients', type=int, default=10000)
+    parser.add_argument('--doctors', type=int, default=20)
+    parser.add_argument('--secretaries', type=int, default=5)
+    parser.add_argument('--appointments-per-patient', type=float, default=3.0)
+    parser.add_argument('--records-per-patient', type=float, default=2.0)
+    parser.add_argument('--messages', type=int, default=50000)
+    parser.add_argument('--days', type=int, default=365, help='Appointments span this many days around today.')
+    parser.add_argument('--password', default='benchmark', help='Password of every generated user.')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--batch-size', type=int, default=5000)
+    parser.add_argument('--drop', action='store_true', help='Drop and recreate all tables first.')
+    parser.add_argument('--manifest', help='Where to write the dataset manifest (JSON).')
+    args = parser.parse_args()
+    if args.doctors < 1 or args.doctors + args.secretaries < 2:
+        parser.error('Need at least one doctor and two users in total')
+
+    rng = random.Random(args.seed)
+    app = create_app({'SQLALCHEMY_DATABASE_URI': args.database_url, 'PASSWORD_HASH_WORKERS': 0,
+                      'LOG_LEVEL': 'WARNING'})
+    with app.app_context():
+        if args.drop:
+            db.drop_all()
+        db.create_all()
+        if db.session.query(User.id).first() or db.session.query(Patient.id).first():
+            parser.error('The database already has data; pass --drop to replace it')
+
+        # One hash shared by every user: hashing is deliberately slow
+        insert_batches('users', User.__table__,
+                       generate_users(args, password_hasher.hash(args.password)),
+                       args.doctors + args.secretaries, args.batch_size)
+        users = db.session.query(User.id, User.username, User.role).order_by(User.id).all()
+        doctors = [u.username for u in users if u.role == 'doctor']
+        doctor_ids = [u.id for u in users if u.role == 'doctor']
+        secretary_ids = [u.id for u in users if u.role != 'doctor']
+
+        insert_batches('patients', Patient.__table__, generate_patients(args, rng), args.patients, args.batch_size)
+
+        first_day = date.today() - timedelta(days=args.days // 2)
+        last_day = first_day + timedelta(days=args.days - 1)
+        slots = AppointmentSlots(doctors, first_day, last_day)
+        appointments = round(args.patients * args.appointments_per_patient)
+        if appointments > slots.total:
+            parser.error(f'{appointments} appointments do not fit in {slots.total} free slots; '
+                         'add --doctors or --days')
+        insert_batches('appointments', Appointment.__table__,
+                       generate_appointments(args, rng, slots, appointments), appointments, args.batch_size)
+
+        records = round(args.patients * args.records_per_patient)
+        insert_batches('records', PatientRecord.__table__,
+                       generate_records(args, rng, doctors, records), records, args.batch_size)
+
+        insert_batches('messages', Message.__table__,
+                       generate_messages(args, rng, doctor_ids, secretary_ids), args.messages, args.batch_size)
+        db.session.execute(db.text(CONVERSATION_STATE_BACKFILL))
+        db.session.commit()
+
+        manifest = {
+            'seed': args.seed,
+            'generated_at': datetime.utcnow().isoformat(),
+            'password': args.password,
+            'users': [{'id': u.id, 'username': u.username, 'role': u.role} for u in users],
+            'patients': {'count': args.patients, 'first_id': 1, 'last_id': args.patients},
+            'appointments': {'count': appointments, 'from': first_day.isoformat(), 'to': last_day.isoformat()},
+            'records': records,
+            'messages': args.messages,
+            'last_names': LAST_NAMES,
+        }
+    if args.manifest:
+        with open(args.manifest, 'w') as out:
+            json.dump(manifest, out, indent=2)
+    print(json.dumps({key: manifest[key] for key in ('patients', 'appointments', 'records', 'messages')}))
+
+
+if __name__ == '__main__':
+    main()
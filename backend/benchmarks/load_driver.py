@@ -0,0 +1,282 @@
+"""Concurrent HTTP load driver replaying a clinic-day mix against a running server.
+
+Each virtual user logs in as one of the users in the manifest written by
+generate_data.py, then loops over weighted actions: opening the dashboard,
+paging and searching patients, opening a patient with their records, the
+calendar, chat polling and sending, editing records, checking availability
+and logging in again, so password hashing is measured after the warm-up
+too. Latencies are reported per endpoint (method + URL template) as
+JSON, and --compare prints the change against an earlier run's JSON.
+
+Run from backend/, against a server started on the generated database:
+    DATABASE_URL=sqlite:////tmp/medico-bench.db flask --app app run --port 5000
+    python benchmarks/load_driver.py --manifest /tmp/medico-bench.json --users 20 --duration 60 \\
+        --output after.json --compare before.json
+"""
+import argparse
+import http.client
+import json
+import random
+import sys
+import threading
+import time
+from datetime import date, timedelta
+from urllib.parse import urlencode, urlparse
+
+
+def percentile(values, pct):
+    if not values:
+        return None
+    values = sorted(values)
+    return values[min(len(values) - 1, int(round(pct / 100 * (len(values) - 1))))]
+
+
+class Results:
+    def __init__(self, warmup_until):
+        self.warmup_until = warmup_until
+        self._lock = threading.Lock()
+        self.samples = {}  # endpoint -> [latency seconds]
+        self.errors = {}   # endpoint -> count
+
+    def record(self, endpoint, latency, ok):
+        if time.monotonic() < self.warmup_until:
+            return
+        with self._lock:
+            self.samples.setdefault(endpoint, []).append(latency)
+            if not ok:
+                self.errors[endpoint] = self.errors.get(endpoint, 0) + 1
+
+    def summary(self, elapsed):
+        def stats(latencies, errors):
+            return {
+                'count': len(latencies),
+                'errors': errors,
+                'throughput_rps': round(len(latencies) / elapsed, 2),
+                'mean_ms': round(sum(latencies) / len(latencies) * 1000, 2) if latencies else None,
+                'p50_ms': round(percentile(latencies, 50) * 1000, 2) if latencies else None,
+                'p95_ms': round(percentile(latencies, 95) * 1000, 2) if latencies else None,
+                'p99_ms': round(percentile(latencies, 99) * 1000, 2) if latencies else None,
+                'max_ms': round(max(latencies) * 1000, 2) if latencies else None,
+            }
+        with self._lock:
+            endpoints = {name: stats(values, self.errors.get(name, 0))
+                         for name, values in sorted(self.samples.items())}
+            everything = [value for values in self.samples.values() for value in values]
+            total = stats(everything, sum(self.errors.values()))
+        return endpoints, total
+
+
+class Client:
+    """One keep-alive connection and one login per virtual user."""
+
+    def __init__(self, base_url, results):
+        parsed = urlparse(base_url)
+        self.host, self.port = parsed.hostname, parsed.port or 80
+        self.results = results
+        self.connection = None
+        self.token = None
+
+    def request(self, endpoint, method, path, body=None, auth=True):
+        headers = {'Content-Type': 'application/json'}
+        if auth and self.token:
+            headers['Authorization'] = f'Bearer {self.token}'
+        payload = json.dumps(body).encode() if body is not None else None
+        started = time.perf_counter()
+        try:
+            if self.connection is None:
+                self.connection = http.client.HTTPConnection(self.host, self.port, timeout=30)
+            self.connection.request(method, path, body=payload, headers=headers)
+            response = self.connection.getresponse()
+            data = response.read()
+            status = response.status
+        except (OSError, http.client.HTTPException):
+            self.connection = None
+            self.results.record(endpoint, time.perf_counter() - started, False)
+            return None, None
+        self.results.record(endpoint, time.perf_counter() - started, status < 400)
+        try:
+            return status, json.loads(data) if data else None
+        except ValueError:
+            return status, None
+
+    def login(self, username, password):
+        status, data = self.request('POST /api/login', 'POST', '/api/login',
+                                    {'username': username, 'password': password}, auth=False)
+        self.token = data.get('access_token') if status == 200 and data else None
+        return self.token is not None
+
+
+class VirtualUser(threading.Thread):
+    def __init__(self, index, args, manifest, results, stop_at):
+        super().__init__(daemon=True)
+        self.rng = random.Random(args.seed + index)
+        self.args = args
+        self.manifest = manifest
+        self.stop_at = stop_at
+        self.client = Client(args.url, results)
+        users = manifest['users']
+        self.user = users[index % len(users)]
+        self.partners = [u for u in users if u['id'] != self.user['id']]
+        self.doctors = [u['username'] for u in users if u['role'] == 'doctor']
+        self.last_seen = {}  # partner id -> newest message id seen
+        self.today = date.today().isoformat()
+
+        actions = [
+            (self.dashboard, 20), (self.patient_list, 10), (self.patient_search, 8),
+            (self.patient_detail, 15), (self.calendar, 7), (self.chat_poll, 25),
+            (self.send_message, 5), (self.availability, 5), (self.relogin, 2),
+        ]
+        if self.user['role'] == 'doctor':
+            actions.append((self.edit_record, 5))
+        self.actions = [action for action, _ in actions]
+        self.weights = [weight for _, weight in actions]
+
+    def patient_id(self):
+        patients = self.manifest['patients']
+        return self.rng.randint(patients['first_id'], patients['last_id'])
+
+    def dashboard(self):
+        # Doctors open DoctorDashboard, which loads in one request; secretaries
+        # still see the day's appointments and their conversations
+        if self.user['role'] == 'doctor':
+            self.client.request('GET /api/dashboard/doctor', 'GET',
+                                '/api/dashboard/doctor?' + urlencode({'date': self.today}))
+            return
+        params = {'from': self.today, 'to': self.today}
+        self.client.request('GET /api/appointments', 'GET', '/api/appointments?' + urlencode(params))
+        self.client.request('GET /api/messages/conversations', 'GET', '/api/messages/conversations')
+
+    def patient_list(self):
+        status, data = self.client.request('GET /api/patients', 'GET', '/api/patients?limit=50')
+        if status == 200 and data and data.get('next_cursor') and self.rng.random() < 0.5:
+            self.client.request('GET /api/patients', 'GET',
+                                '/api/patients?' + urlencode({'limit': 50, 'cursor': data['next_cursor']}))
+
+    def patient_search(self):
+        name = self.rng.choice(self.manifest['last_names'])
+        query = name[:self.rng.randint(3, len(name))]
+        self.client.request('GET /api/patients/search', 'GET', '/api/patients/search?' + urlencode({'q': query}))
+
+    def patient_detail(self):
+        # PatientDetail loads the chart as one bundle: the patient, the first
+        # page of records and the coming year's appointments
+        patient_id = self.patient_id()
+        params = {
+            'include': 'appointments,records', 'appointments_from': self.today,
+            'appointments_to': (date.today() + timedelta(days=365)).isoformat(),
+        }
+        self.client.request('GET /api/patients/<id>?include', 'GET',
+                            f'/api/patients/{patient_id}?' + urlencode(params))
+
+    def calendar(self):
+        start = date.today().replace(day=1)
+        end = (start + timedelta(days=32)).replace(day=1) - timedelta(days=1)
+        self.client.request('GET /api/calendar', 'GET', '/api/calendar?' + urlencode(
+            {'from': start.isoformat(), 'to': end.isoformat(), 'mode': 'events'}))
+
+    def chat_poll(self):
+        partner = self.rng.choice(self.partners)
+        params = {'user_id': partner['id']}
+        if partner['id'] in self.last_seen:
+            params['since_id'] = self.last_seen[partner['id']]
+        status, data = self.client.request('GET /api/messages', 'GET', '/api/messages?' + urlencode(params))
+        if status == 200 and data:
+            self.last_seen[partner['id']] = max(message['id'] for message in data)
+
+    def send_message(self):
+        partner = self.rng.choice(self.partners)
+        self.client.request('POST /api/messages', 'POST', '/api/messages',
+                            {'recipient_id': partner['id'], 'content': 'Load test message'})
+
+    def availability(self):
+        doctor = self.rng.choice(self.doctors)
+        end = (date.today() + timedelta(days=6)).isoformat()
+        self.client.request('GET /api/doctors/<doctor>/availability', 'GET',
+                            f'/api/doctors/{doctor}/availability?' + urlencode({'from': self.today, 'to': end}))
+
+    def edit_record(self):
+        patient_id = self.patient_id()
+        status, records = self.client.request('GET /api/patients/<id>/records', 'GET',
+                                              f'/api/patients/{patient_id}/records?fields=id')
+        if status == 200 and records:
+            record = self.rng.choice(records)
+            self.client.request('PUT /api/patients/<id>/records/<id>', 'PUT',
+                                f"/api/patients/{patient_id}/records/{record['id']}",
+                                {'notes': f'Reviewed during load test ({self.rng.randint(0, 10 ** 6)})'})
+
+    def relogin(self):
+        # A failed login keeps the current token so the session carries on
+        token = self.client.token
+        if not self.client.login(self.user['username'], self.manifest['password']):
+            self.client.token = token
+
+    def run(self):
+        if not self.client.login(self.user['username'], self.manifest['password']):
+            return
+        while time.monotonic() < self.stop_at:
+            self.rng.choices(self.actions, self.weights)[0]()
+            if self.args.think_time:
+                time.sleep(self.rng.expovariate(1 / self.args.think_time))
+
+
+def compare(report, baseline):
+    rows = []
+    for endpoint, stats in report['endpoints'].items():
+        before = baseline.get('endpoints', {}).get(endpoint)
+        if not before or not before.get('p95_ms') or not stats.get('p95_ms'):
+            continue
+        rows.append((endpoint, before['p95_ms'], stats['p95_ms'],
+                     (stats['p95_ms'] - before['p95_ms']) / before['p95_ms'] * 100,
+                     before['throughput_rps'], stats['throughput_rps']))
+    print(f"{'endpoint':45} {'p95 before':>11} {'p95 after':>10} {'change':>8} {'rps before':>11} {'rps after':>10}",
+          file=sys.stderr)
+    for endpoint, p95_before, p95_after, change, rps_before, rps_after in rows:
+        print(f'{endpoint:45} {p95_before:11.2f} {p95_after:10.2f} {change:+7.1f}% {rps_before:11.2f} {rps_after:10.2f}',
+              file=sys.stderr)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--url', default='http://127.0.0.1:5000')
+    parser.add_argument('--manifest', required=True, help='Manifest written by generate_data.py.')
+    parser.add_argument('--users', type=int, default=20, help='Concurrent virtual users.')
+    parser.add_argument('--duration', type=float, default=60.0, help='Seconds to run, after warm-up.')
+    parser.add_argument('--warmup', type=float, default=5.0, help='Seconds of load not counted in the results.')
+    parser.add_argument('--think-time', type=float, default=0.0, help='Mean pause between actions, in seconds.')
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--output', help='Write the JSON report here as well as to stdout.')
+    parser.add_argument('--compare', help='Earlier JSON report to compare p95 and throughput against.')
+    args = parser.parse_args()
+
+    with open(args.manifest) as source:
+        manifest = json.load(source)
+    started = time.monotonic()
+    results = Results(warmup_until=started + args.warmup)
+    stop_at = started + args.warmup + args.duration
+    users = [VirtualUser(index, args, manifest, results, stop_at) for index in range(args.users)]
+    for user in users:
+        user.start()
+    for user in users:
+        user.join()
+
+    endpoints, total = results.summary(args.duration)
+    report = {
+        'meta': {
+            'url': args.url, 'users': args.users, 'duration': args.duration, 'warmup': args.warmup,
+            'think_time': args.think_time, 'seed': args.seed, 'dataset_seed': manifest.get('seed'),
+            'patients': manifest['patients']['count'],
+        },
+        'total': total,
+        'endpoints': endpoints,
+    }
+    print(json.dumps(report, indent=2))
+    if args.output:
+        with open(args.output, 'w') as out:
+            json.dump(report, out, indent=2)
+    if args.compare:
+        with open(args.compare) as source:
+            compare(report, json.load(source))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+import re
+import zlib
+from sqlalchemy.types import LargeBinary, TypeDecorator
+
+# Values at least this long (UTF-8 bytes) are stored compressed; shorter ones
+# would gain little and pay the zlib header
+COMPRESS_MIN_BYTES = 256
+COMPRESS_LEVEL = 6
+
+# First byte of every stored value says how the rest is encoded
+_PLAIN = b't'
+_ZLIB = b'z'
+
+_WHITESPACE = re.compile(r'\s+')
+
+
+def encode_text(value, min_bytes=COMPRESS_MIN_BYTES, level=COMPRESS_LEVEL):
+    """Stored form of a string: tagged UTF-8, zlib-compressed when that is smaller."""
+    if value is None:
+        return None
+    data = value.encode('utf-8')
+    if len(data) >= min_bytes:
+        compressed = zlib.compress(data, level)
+        if len(compressed) < len(data):
+            return _ZLIB + compressed
+    return _PLAIN + data
+
+
+def decode_text(value):
+    if value is None:
+        return None
+    value = bytes(value)
+    tag, data = value[:1], value[1:]
+    if tag == _ZLIB:
+        data = zlib.decompress(data)
+    elif tag != _PLAIN:
+        raise ValueError(f'Unknown text encoding tag {tag!r}')
+    return data.decode('utf-8')
+
+
+def make_excerpt(value, length):
+    """First `length` characters of value on one line, ending in an ellipsis when cut."""
+    text = _WHITESPACE.sub(' ', value or '').strip()
+    if len(text) <= length:
+        return text
+    return text[:length - 1].rstrip() + '…'
+
+
+class CompressedText(TypeDecorator):
+    """Text column stored as bytes and compressed with zlib when large.
+
+    Reads and writes plain str, including through Core inserts; the column
+    itself is LargeBinary (bytea on PostgreSQL), so it is not searchable in SQL.
+    """
+
+    impl = LargeBinary
+    cache_ok = True
+
+    def __init__(self, min_bytes=COMPRESS_MIN_BYTES, level=COMPRESS_LEVEL):
+        super().__init__()
+        self.min_bytes = min_bytes
+        self.level = level
+
+    @property
+    def python_type(self):
+        return str
+
+    def process_bind_param(self, value, dialect):
+        return encode_text(value, self.min_bytes, self.level)
+
+    def process_result_value(self, value, dialect):
+        return decode_text(value)
@@ -0,0 +1,54 @@
+from sqlalchemy.dialects import postgresql, sqlite
+from models import db, ConversationState
+
+_UPSERT_DIALECTS = {'postgresql': postgresql.insert, 'sqlite': sqlite.insert}
+
+
+def _upsert_state(user_id, partner_id, message_id, unread_increment):
+    table = ConversationState.__table__
+    newer_message_id = db.case(
+        (table.c.last_message_id.is_(None) | (table.c.last_message_id < message_id), message_id),
+        else_=table.c.last_message_id
+    )
+    insert = _UPSERT_DIALECTS.get(db.session.get_bind().dialect.name)
+    if insert is not None:
+        stmt = insert(table).values(
+            user_id=user_id, partner_id=partner_id,
+            unread_count=unread_increment, last_message_id=message_id
+        ).on_conflict_do_update(
+            index_elements=['user_id', 'partner_id'],
+            set_={'unread_count': table.c.unread_count + unread_increment, 'last_message_id': newer_message_id}
+        )
+        db.session.execute(stmt)
+        return
+
+    updated = db.session.execute(
+        table.update()
+        .where(table.c.user_id == user_id, table.c.partner_id == partner_id)
+        .values(unread_count=table.c.unread_count + unread_increment, last_message_id=newer_message_id)
+    ).rowcount
+    if not updated:
+        db.session.execute(table.insert().values(
+            user_id=user_id, partner_id=partner_id,
+            unread_count=unread_increment, last_message_id=message_id
+        ))
+
+
+def record_message_sent(message):
+    """Updates both participants' conversation state for a new, flushed Message."""
+    _upsert_state(message.recipient_id, message.sender_id, message.id, 1)
+    _upsert_state(message.sender_id, message.recipient_id, message.id, 0)
+
+
+def record_messages_read(user_id, partner_id, count):
+    """Adjusts user_id's unread counter for partner_id by -count (or +count when negative)."""
+    if not count:
+        return
+    table = ConversationState.__table__
+    db.session.execute(
+        table.update()
+        .where(table.c.user_id == user_id, table.c.partner_id == partner_id)
+        .values(unread_count=db.case(
+            (table.c.unread_count > count, table.c.unread_count - count), else_=0
+        ))
+    )
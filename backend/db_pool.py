@@ -0,0 +1,144 @@
+import threading
+import time
+from collections import deque
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool
+
+# Recent checkout waits kept for the percentiles in pool_status()
+WAIT_SAMPLES = 1000
+
+
+def engine_options(config):
+    """SQLALCHEMY_ENGINE_OPTIONS derived from the DB_POOL_* settings.
+
+    In-memory SQLite keeps Flask-SQLAlchemy's single shared connection, so
+    only pre-ping applies there.
+    """
+    options = {'pool_pre_ping': config['DB_POOL_PRE_PING']}
+    url = make_url(config['SQLALCHEMY_DATABASE_URI'])
+    if url.get_backend_name() == 'sqlite' and url.database in (None, '', ':memory:'):
+        return options
+    options.update(
+        poolclass=InstrumentedQueuePool,
+        pool_size=config['DB_POOL_SIZE'],
+        max_overflow=config['DB_POOL_MAX_OVERFLOW'],
+        pool_timeout=config['DB_POOL_TIMEOUT'],
+        pool_recycle=config['DB_POOL_RECYCLE'],
+    )
+    return options
+
+
+class PoolMetrics:
+    """Counters and checkout wait samples for one connection pool."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._waits = deque(maxlen=WAIT_SAMPLES)
+        self.checkouts = 0
+        self.checkins = 0
+        self.connects = 0
+        self.overflow_connects = 0
+        self.invalidations = 0
+        self.timeouts = 0
+        self.waits = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    def increment(self, name):
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def record_wait(self, seconds):
+        with self._lock:
+            self._waits.append(seconds)
+            self.waits += 1
+            self.wait_total += seconds
+            self.wait_max = max(self.wait_max, seconds)
+
+    def snapshot(self):
+        with self._lock:
+            waits = sorted(self._waits)
+            counters = {
+                'checkouts': self.checkouts,
+                'checkins': self.checkins,
+                'connects': self.connects,
+                'overflow_connects': self.overflow_connects,
+                'invalidations': self.invalidations,
+                'timeouts': self.timeouts,
+            }
+            count, total, worst = self.waits, self.wait_total, self.wait_max
+
+        def percentile(pct):
+            return round(waits[min(len(waits) - 1, int(pct / 100 * len(waits)))] * 1000, 3) if waits else None
+
+        counters['wait_ms'] = {
+            'mean': round(total / count * 1000, 3) if count else None,
+            'p50': percentile(50),
+            'p95': percentile(95),
+            'p99': percentile(99),
+            'max': round(worst * 1000, 3),
+            'count': count,
+        }
+        return counters
+
+
+class InstrumentedQueuePool(QueuePool):
+    """QueuePool that records checkout waits and pool events in self.metrics.
+
+    The wait is the time a request spent in the pool getting a connection:
+    queueing for a free one, or opening a new one when there is room to.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+        event.listen(self, 'checkout', self._on_checkout)
+        event.listen(self, 'checkin', self._on_checkin)
+        event.listen(self, 'connect', self._on_connect)
+        event.listen(self, 'invalidate', self._on_invalidate)
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            self.metrics.increment('timeouts')
+            raise
+        finally:
+            self.metrics.record_wait(time.perf_counter() - started)
+
+    def _on_checkout(self, dbapi_connection, connection_record, connection_proxy):
+        self.metrics.increment('checkouts')
+
+    def _on_checkin(self, dbapi_connection, connection_record):
+        self.metrics.increment('checkins')
+
+    def _on_connect(self, dbapi_connection, connection_record):
+        self.metrics.increment('connects')
+        # overflow() counts up from -pool_size, so above zero this connection is beyond the pool
+        if self.overflow() > 0:
+            self.metrics.increment('overflow_connects')
+
+    def _on_invalidate(self, dbapi_connection, connection_record, exception):
+        self.metrics.increment('invalidations')
+
+
+def pool_status(engine):
+    """Live state of engine's pool plus, when instrumented, its metrics."""
+    pool = engine.pool
+    status = {'pool': type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        status.update(
+            size=pool.size(),
+            checked_out=pool.checkedout(),
+            idle=pool.checkedin(),
+            overflow=max(pool.overflow(), 0),
+            max_overflow=pool._max_overflow,
+            timeout=pool.timeout(),
+        )
+    metrics = getattr(pool, 'metrics', None)
+    if metrics is not None:
+        status.update(metrics.snapshot())
+    return status
@@ -0,0 +1,244 @@
+import json
+import socket
+import threading
+import time
+from collections import OrderedDict
+from urllib.parse import urlparse
+from flask import current_app, has_app_context
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from models import db
+from serializers import encode_json
+from versions import current_versions, version_keys
+
+# Defaults, overridable through app.config
+DEFAULT_CACHE_URL = 'memory://'   # or redis://host:port/db for a shared cache
+DEFAULT_CACHE_TTL = 300           # seconds an entry is served without touching the database
+DEFAULT_CACHE_MAXSIZE = 10000     # entries kept by the in-process backend
+DEFAULT_CACHE_PREFIX = 'medico:'  # namespace for keys in a shared backend
+BACKEND_RETRY_DELAY = 5           # seconds a failed backend is bypassed before it is tried again
+
+
+def _config(key, default):
+    if has_app_context():
+        return current_app.config.get(key, default)
+    return default
+
+
+class MemoryBackend:
+    """In-process LRU of key -> bytes with a per-entry TTL."""
+
+    def __init__(self, maxsize=DEFAULT_CACHE_MAXSIZE):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()  # key -> (expires_at, value)
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= now:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key, value, ttl):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class RedisBackend:
+    """Minimal RESP2 client for GET/SET against Redis or any compatible server.
+
+    Speaks the wire protocol directly so no client library is required; each
+    thread keeps its own connection and reconnects after a failure.
+    """
+
+    def __init__(self, url, timeout=0.5):
+        parsed = urlparse(url)
+        self.host = parsed.hostname or 'localhost'
+        self.port = parsed.port or 6379
+        self.db = int(parsed.path.lstrip('/') or 0)
+        self.password = parsed.password
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def _connect(self):
+        sock = socket.create_connection((self.host, self.port), timeout=self.timeout)
+        conn = (sock, sock.makefile('rb'))
+        self._local.conn = conn
+        if self.password:
+            self._call('AUTH', self.password)
+        if self.db:
+            self._call('SELECT', self.db)
+        return conn
+
+    def _call(self, *args):
+        conn = getattr(self._local, 'conn', None) or self._connect()
+        sock, reader = conn
+        parts = [b'*%d\r\n' % len(args)]
+        for arg in args:
+            arg = arg if isinstance(arg, bytes) else str(arg).encode()
+            parts.append(b'$%d\r\n%s\r\n' % (len(arg), arg))
+        try:
+            sock.sendall(b''.join(parts))
+            return self._read(reader)
+        except (OSError, ConnectionError):
+            self._local.conn = None
+            sock.close()
+            raise
+
+    def _read(self, reader):
+        line = reader.readline()
+        if not line:
+            raise ConnectionError('Cache server closed the connection')
+        kind, rest = line[:1], line[1:-2]
+        if kind == b'+':
+            return rest
+        if kind == b'-':
+            raise ConnectionError(rest.decode())
+        if kind == b':':
+            return int(rest)
+        if kind == b'$':
+            length = int(rest)
+            if length < 0:
+                return None
+            return reader.read(length + 2)[:-2]
+        if kind == b'*':
+            return [self._read(reader) for _ in range(int(rest))]
+        raise ConnectionError(f'Unexpected reply from cache server: {line!r}')
+
+    def get(self, key):
+        return self._call('GET', key)
+
+    def set(self, key, value, ttl):
+        self._call('SET', key, value, 'PX', int(ttl * 1000))
+
+    def clear(self):
+        self._call('FLUSHDB')
+
+
+def make_backend(url, maxsize=DEFAULT_CACHE_MAXSIZE):
+    scheme = urlparse(url).scheme
+    if scheme == 'memory':
+        return MemoryBackend(maxsize)
+    if scheme == 'redis':
+        return RedisBackend(url)
+    raise ValueError(f'Unsupported ENTITY_CACHE_URL: {url}')
+
+
+class EntityCache:
+    """Read-through cache of serialized entities, keyed like versions.version_keys.
+
+    Values are the JSON payloads the read endpoints return. Each entry's key
+    carries the data versions it was loaded at, so a write in any worker
+    makes every process look up a new key instead of relying on deletes
+    reaching its backend. Superseded entries age out through the TTL, and a
+    backend that fails is bypassed so requests fall back to the database.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._backend = None
+        self._url = None
+        self._retry_at = 0
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+
+    def backend(self):
+        url = _config('ENTITY_CACHE_URL', DEFAULT_CACHE_URL)
+        with self._lock:
+            if self._backend is None or self._url != url:
+                self._backend = make_backend(url, _config('ENTITY_CACHE_MAXSIZE', DEFAULT_CACHE_MAXSIZE))
+                self._url = url
+            return self._backend
+
+    def _call(self, method, *args):
+        # Fails fast while a recently failed backend is being bypassed
+        if time.monotonic() < self._retry_at:
+            raise ConnectionError('Cache backend unavailable')
+        try:
+            return getattr(self.backend(), method)(*args)
+        except (OSError, ConnectionError):
+            self._retry_at = time.monotonic() + BACKEND_RETRY_DELAY
+            raise
+
+    def _key(self, key):
+        return _config('ENTITY_CACHE_PREFIX', DEFAULT_CACHE_PREFIX) + key
+
+    def _count(self, name):
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def get_or_load(self, key, loader):
+        """Returns the cached payload for key, or loader()'s result after caching it.
+
+        key is a version key; the entry is reused only while its version is
+        unchanged, which the request's ETag check has usually loaded already.
+        A loader returning None (entity not found) is not cached, nor is
+        anything this transaction has written but not committed yet.
+        """
+        if key in db.session.info.get('entity_cache_stale', ()):
+            return loader()
+        key = f'{key}:v{current_versions([key])[key][0]}'
+        try:
+            cached = self._call('get', self._key(key))
+        except (OSError, ConnectionError):
+            self._count('errors')
+            cached = None
+        if cached is not None:
+            self._count('hits')
+            return json.loads(cached)
+
+        self._count('misses')
+        payload = loader()
+        if payload is not None:
+            try:
+                self._call('set', self._key(key), encode_json(payload),
+                           _config('ENTITY_CACHE_TTL', DEFAULT_CACHE_TTL))
+            except (OSError, ConnectionError):
+                self._count('errors')
+        return payload
+
+    def clear(self):
+        self.backend().clear()
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'backend': urlparse(self._url or DEFAULT_CACHE_URL).scheme,
+                'hits': self.hits,
+                'misses': self.misses,
+                'errors': self.errors,
+                'hit_ratio': round(self.hits / lookups, 4) if lookups else None,
+            }
+
+
+entity_cache = EntityCache()
+
+
+@event.listens_for(Session, 'after_flush')
+def _collect_stale_keys(session, flush_context):
+    # Until commit the new versions are visible only to this transaction,
+    # which must not cache rows that may still be rolled back
+    stale = session.info.setdefault('entity_cache_stale', set())
+    for obj in list(session.new) + list(session.dirty) + list(session.deleted):
+        stale.update(version_keys(obj))
+
+
+@event.listens_for(Session, 'after_commit')
+@event.listens_for(Session, 'after_rollback')
+def _forget_stale_keys(session):
+    session.info.pop('entity_cache_stale', None)
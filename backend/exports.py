@@ -0,0 +1,104 @@
+import csv
+import io
+import zlib
+from models import db, Patient, Appointment, PatientRecord
+from serializers import patient_serializer, appointment_serializer, patient_record_serializer, encode_json
+
+# Rows fetched per round trip from the server-side cursor
+EXPORT_BATCH_SIZE = 1000
+# Output is buffered into chunks of roughly this many bytes before being sent
+EXPORT_CHUNK_SIZE = 64 * 1024
+
+
+def _patients_query(filters):
+    query = Patient.query
+    if filters.get('insurance'):
+        query = query.filter(Patient.medical_insurance == filters['insurance'])
+    return query.order_by(Patient.id)
+
+
+def _appointments_query(filters):
+    query = Appointment.query.join(Appointment.patient).options(
+        db.contains_eager(Appointment.patient).load_only(Patient.first_name, Patient.last_name)
+    )
+    if filters.get('from'):
+        query = query.filter(Appointment.appointment_date >= filters['from'])
+    if filters.get('to'):
+        query = query.filter(Appointment.appointment_date <= filters['to'])
+    if filters.get('doctor'):
+        query = query.filter(Appointment.doctor == filters['doctor'])
+    return query.order_by(Appointment.appointment_date, Appointment.appointment_time, Appointment.id)
+
+
+def _records_query(filters):
+    query = PatientRecord.query
+    if filters.get('from'):
+        query = query.filter(PatientRecord.record_date >= filters['from'])
+    if filters.get('to'):
+        # to is a date; include the whole day
+        query = query.filter(db.func.date(PatientRecord.record_date) <= filters['to'])
+    if filters.get('doctor'):
+        query = query.filter(PatientRecord.doctor == filters['doctor'])
+    # Exports carry the full notes, which are deferred by default
+    return query.options(db.undefer(PatientRecord.notes)).order_by(PatientRecord.id)
+
+
+# entity name -> (query builder taking a filters dict, serializer)
+EXPORTS = {
+    'patients': (_patients_query, patient_serializer),
+    'appointments': (_appointments_query, appointment_serializer),
+    'records': (_records_query, patient_record_serializer),
+}
+
+
+def _ndjson_lines(objs, serializer):
+    for obj in objs:
+        yield encode_json(serializer.dump(obj, serializer.fields)) + b'\n'
+
+
+def _csv_lines(objs, serializer):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(serializer.fields)
+    for obj in objs:
+        row = serializer.dump(obj, serializer.fields)
+        writer.writerow([row[field] for field in serializer.fields])
+        yield buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+
+def _chunked(lines):
+    chunk, size = [], 0
+    for line in lines:
+        chunk.append(line)
+        size += len(line)
+        if size >= EXPORT_CHUNK_SIZE:
+            yield b''.join(chunk)
+            chunk, size = [], 0
+    if chunk:
+        yield b''.join(chunk)
+
+
+def _gzipped(chunks):
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)  # wbits=31 writes a gzip container
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def export_rows(entity, filters, fmt='ndjson', gzip=False):
+    """Generator of response body chunks for an export, in constant memory.
+
+    Rows are read through a server-side cursor (yield_per) and written out as
+    they arrive, so the first bytes go out before the query finishes.
+    """
+    build_query, serializer = EXPORTS[entity]
+    objs = build_query(filters).yield_per(EXPORT_BATCH_SIZE)
+    lines = _csv_lines(objs, serializer) if fmt == 'csv' else _ndjson_lines(objs, serializer)
+    chunks = _chunked(lines)
+    return _gzipped(chunks) if gzip else chunks
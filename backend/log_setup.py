@@ -0,0 +1,154 @@
+import atexit
+import copy
+import json
+import logging
+import queue
+import random
+import sys
+import threading
+import time
+import uuid
+import zlib
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from flask import g, has_request_context, request
+
+access_logger = logging.getLogger('medico.access')
+
+# Attributes every LogRecord has; anything else was passed through `extra`
+_RECORD_ATTRS = set(vars(logging.LogRecord('', 0, '', 0, '', (), None))) | {'message', 'asctime'}
+
+
+class RequestContextFilter(logging.Filter):
+    """Stamps records with the current request id, method and path.
+
+    Runs on the thread that logs, so the request context is still available
+    before the record is handed to the queue.
+    """
+
+    def filter(self, record):
+        if has_request_context():
+            record.request_id = g.get('request_id')
+            record.method = request.method
+            record.path = request.path
+        return True
+
+
+class SamplingFilter(logging.Filter):
+    """Keeps `rate` of the records below WARNING; warnings and errors are always kept.
+
+    Inside a request the decision is derived from the request id, so a
+    sampled request keeps all of its records and a dropped one loses them all.
+    """
+
+    def __init__(self, rate):
+        super().__init__()
+        self.rate = rate
+
+    def filter(self, record):
+        if record.levelno >= logging.WARNING or self.rate >= 1:
+            return True
+        request_id = getattr(record, 'request_id', None)
+        if request_id:
+            return zlib.crc32(request_id.encode()) % 10000 < self.rate * 10000
+        return random.random() < self.rate
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line with the record's extra fields at top level."""
+
+    def format(self, record):
+        entry = {
+            'ts': datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRS and not key.startswith('_'):
+                entry[key] = value
+        if record.exc_info:
+            entry['exc_info'] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry['exc_info'] = record.exc_text
+        return json.dumps(entry, default=str)
+
+
+class DroppingQueueHandler(QueueHandler):
+    """QueueHandler that drops records instead of blocking when the queue is full."""
+
+    def __init__(self, log_queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record):
+        # Render the message and traceback on the caller's thread, while the
+        # arguments are still valid, and leave the layout to the listener's formatter
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+_lock = threading.Lock()
+_listener = None
+
+
+def _start_listener(config):
+    global _listener
+    formatter = JsonFormatter() if config['LOG_FORMAT'] == 'json' else logging.Formatter(
+        '%(asctime)s %(levelname)s %(name)s [%(request_id)s] %(message)s', defaults={'request_id': '-'}
+    )
+    output = logging.StreamHandler(sys.stdout)
+    output.setFormatter(formatter)
+
+    log_queue = queue.Queue(config['LOG_QUEUE_SIZE'])
+    handler = DroppingQueueHandler(log_queue)
+    handler.addFilter(RequestContextFilter())
+    handler.addFilter(SamplingFilter(config['LOG_SAMPLE_RATE']))
+
+    root = logging.getLogger()
+    root.addHandler(handler)
+    root.setLevel(config['LOG_LEVEL'])
+    _listener = QueueListener(log_queue, output, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)
+
+
+def _assign_request_id():
+    g.request_id = request.headers.get('X-Request-ID') or uuid.uuid4().hex
+    g.log_started = time.perf_counter()
+
+
+def _log_access(response):
+    response.headers['X-Request-ID'] = g.get('request_id', '')
+    started = g.get('log_started')
+    if started is not None:
+        access_logger.info('%s %s %s', request.method, request.path, response.status_code, extra={
+            'status': response.status_code,
+            'duration_ms': round((time.perf_counter() - started) * 1000, 2),
+        })
+    return response
+
+
+def init_app(app):
+    """Routes this process's logging through a queue drained by a background thread.
+
+    Request threads only format the message and enqueue the record; writing
+    to stdout happens on the listener thread. Records carry the request id,
+    which is taken from X-Request-ID when the client sends one and echoed back.
+    """
+    with _lock:
+        if _listener is None:
+            _start_listener(app.config)
+    app.before_request(_assign_request_id)
+    app.after_request(_log_access)
@@ -0,0 +1,39 @@
+import threading
+
+
+class MessageNotifier:
+    """Wakes up clients waiting for new messages without polling the database.
+
+    send_message publishes the id of every committed Message to both
+    participants; long-poll and stream handlers block in wait() until a
+    message newer than the one they last saw arrives or the timeout expires.
+    State is per process, so callers must query the database after every
+    wait, including timeouts, to pick up messages sent through other workers.
+    """
+
+    def __init__(self):
+        self._condition = threading.Condition()
+        self._latest = {}  # user id -> id of the newest message published for that user
+
+    def publish(self, user_ids, message_id):
+        with self._condition:
+            for user_id in user_ids:
+                if message_id > self._latest.get(user_id, 0):
+                    self._latest[user_id] = message_id
+            self._condition.notify_all()
+
+    def wait(self, user_id, after_id, timeout):
+        """Blocks until a message newer than after_id is published for user_id.
+
+        Returns the id of the newest message published for user_id, which is
+        not above after_id on timeout. The message may belong to any of the
+        user's conversations, so callers filtering by partner pass the
+        returned id back as after_id to block until the next one instead of
+        waking straight away again.
+        """
+        with self._condition:
+            self._condition.wait_for(lambda: self._latest.get(user_id, 0) > after_id, timeout=timeout)
+            return self._latest.get(user_id, 0)
+
+
+message_notifier = MessageNotifier()
@@ -0,0 +1,48 @@
+"""Add indexes for hot query paths
+
+Revision ID: 3a7c2e9d41b6
+Revises: 76f06c73280d
+Create Date: 2026-10-18 10:12:31.482915
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3a7c2e9d41b6'
+down_revision = '76f06c73280d'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('patient', schema=None) as batch_op:
+        batch_op.create_index('ix_patient_last_name_id', ['last_name', 'id'], unique=False)
+
+    with op.batch_alter_table('appointment', schema=None) as batch_op:
+        batch_op.create_index('ix_appointment_date_time', ['appointment_date', 'appointment_time'], unique=False)
+        batch_op.create_index('ix_appointment_doctor_date', ['doctor', 'appointment_date'], unique=False)
+        batch_op.create_index('ix_appointment_patient_date', ['patient_id', 'appointment_date'], unique=False)
+
+    with op.batch_alter_table('patient_record', schema=None) as batch_op:
+        batch_op.create_index('ix_patient_record_patient_date', ['patient_id', 'record_date'], unique=False)
+
+    with op.batch_alter_table('message', schema=None) as batch_op:
+        batch_op.create_index('ix_message_conversation', ['sender_id', 'recipient_id', 'created_at'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('message', schema=None) as batch_op:
+        batch_op.drop_index('ix_message_conversation')
+
+    with op.batch_alter_table('patient_record', schema=None) as batch_op:
+        batch_op.drop_index('ix_patient_record_patient_date')
+
+    with op.batch_alter_table('appointment', schema=None) as batch_op:
+        batch_op.drop_index('ix_appointment_patient_date')
+        batch_op.drop_index('ix_appointment_doctor_date')
+        batch_op.drop_index('ix_appointment_date_time')
+
+    with op.batch_alter_table('patient', schema=None) as batch_op:
+        batch_op.drop_index('ix_patient_last_name_id')
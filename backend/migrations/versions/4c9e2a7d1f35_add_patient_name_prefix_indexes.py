@@ -0,0 +1,30 @@
+"""Add lower(name) indexes for the patient list name filter
+
+Revision ID: 4c9e2a7d1f35
+Revises: b5c8d2e7f914
+Create Date: 2026-10-18 19:12:37.118204
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '4c9e2a7d1f35'
+down_revision = 'b5c8d2e7f914'
+branch_labels = None
+depends_on = None
+
+# Must match queries.NAME_PREFIX_COLUMNS
+COLUMNS = ('first_name', 'last_name')
+
+
+def upgrade():
+    # PostgreSQL compares in the "C" collation so a prefix is one index range
+    collate = ' COLLATE "C"' if op.get_bind().dialect.name == 'postgresql' else ''
+    for column in COLUMNS:
+        op.execute(f'CREATE INDEX IF NOT EXISTS ix_patient_{column}_lower ON patient (lower({column}){collate})')
+
+
+def downgrade():
+    for column in reversed(COLUMNS):
+        op.execute(f'DROP INDEX IF EXISTS ix_patient_{column}_lower')
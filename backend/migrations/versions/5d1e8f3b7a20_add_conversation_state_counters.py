@@ -0,0 +1,45 @@
+"""Add conversation_state counters
+
+Revision ID: 5d1e8f3b7a20
+Revises: 3a7c2e9d41b6
+Create Date: 2026-10-18 14:03:52.116204
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5d1e8f3b7a20'
+down_revision = '3a7c2e9d41b6'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('conversation_state',
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('partner_id', sa.Integer(), nullable=False),
+        sa.Column('unread_count', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('last_message_id', sa.Integer(), nullable=True),
+        sa.PrimaryKeyConstraint('user_id', 'partner_id')
+    )
+    # Backfill from existing messages: each message counts towards the
+    # recipient's unread total and is a candidate last message for both sides.
+    op.execute("""
+        INSERT INTO conversation_state (user_id, partner_id, unread_count, last_message_id)
+        SELECT user_id, partner_id, SUM(unread), MAX(id)
+        FROM (
+            SELECT recipient_id AS user_id, sender_id AS partner_id,
+                   CASE WHEN read THEN 0 ELSE 1 END AS unread, id
+            FROM message
+            UNION ALL
+            SELECT sender_id, recipient_id, 0, id
+            FROM message
+        ) AS m
+        GROUP BY user_id, partner_id
+    """)
+
+
+def downgrade():
+    op.drop_table('conversation_state')
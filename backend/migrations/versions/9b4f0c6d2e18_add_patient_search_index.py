@@ -0,0 +1,56 @@
+"""Add patient search index (pg_trgm on PostgreSQL, FTS5 on SQLite)
+
+Revision ID: 9b4f0c6d2e18
+Revises: 5d1e8f3b7a20
+Create Date: 2026-10-18 15:27:09.604311
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9b4f0c6d2e18'
+down_revision = '5d1e8f3b7a20'
+branch_labels = None
+depends_on = None
+
+COLUMNS = 'first_name, last_name, email, home_phone, personal_phone'
+NEW_VALUES = 'new.first_name, new.last_name, new.email, new.home_phone, new.personal_phone'
+OLD_VALUES = 'old.first_name, old.last_name, old.email, old.home_phone, old.personal_phone'
+
+
+def upgrade():
+    dialect = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        op.execute("CREATE INDEX IF NOT EXISTS ix_patient_name_trgm ON patient "
+                   "USING gin ((first_name || ' ' || last_name) gin_trgm_ops)")
+        op.execute("CREATE INDEX IF NOT EXISTS ix_patient_email_trgm ON patient USING gin (email gin_trgm_ops)")
+        op.execute("CREATE INDEX IF NOT EXISTS ix_patient_home_phone_trgm ON patient USING gin (home_phone gin_trgm_ops)")
+        op.execute("CREATE INDEX IF NOT EXISTS ix_patient_personal_phone_trgm ON patient USING gin (personal_phone gin_trgm_ops)")
+    elif dialect == 'sqlite':
+        op.execute(f"CREATE VIRTUAL TABLE IF NOT EXISTS patient_fts USING fts5({COLUMNS}, content='patient', content_rowid='id')")
+        op.execute(f"CREATE TRIGGER IF NOT EXISTS patient_fts_ai AFTER INSERT ON patient BEGIN "
+                   f"INSERT INTO patient_fts(rowid, {COLUMNS}) VALUES (new.id, {NEW_VALUES}); END")
+        op.execute(f"CREATE TRIGGER IF NOT EXISTS patient_fts_ad AFTER DELETE ON patient BEGIN "
+                   f"INSERT INTO patient_fts(patient_fts, rowid, {COLUMNS}) VALUES ('delete', old.id, {OLD_VALUES}); END")
+        op.execute(f"CREATE TRIGGER IF NOT EXISTS patient_fts_au AFTER UPDATE ON patient BEGIN "
+                   f"INSERT INTO patient_fts(patient_fts, rowid, {COLUMNS}) VALUES ('delete', old.id, {OLD_VALUES}); "
+                   f"INSERT INTO patient_fts(rowid, {COLUMNS}) VALUES (new.id, {NEW_VALUES}); END")
+        # Index the patients that already exist
+        op.execute("INSERT INTO patient_fts(patient_fts) VALUES ('rebuild')")
+
+
+def downgrade():
+    dialect = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        op.execute("DROP INDEX IF EXISTS ix_patient_personal_phone_trgm")
+        op.execute("DROP INDEX IF EXISTS ix_patient_home_phone_trgm")
+        op.execute("DROP INDEX IF EXISTS ix_patient_email_trgm")
+        op.execute("DROP INDEX IF EXISTS ix_patient_name_trgm")
+    elif dialect == 'sqlite':
+        op.execute("DROP TRIGGER IF EXISTS patient_fts_au")
+        op.execute("DROP TRIGGER IF EXISTS patient_fts_ad")
+        op.execute("DROP TRIGGER IF EXISTS patient_fts_ai")
+        op.execute("DROP TABLE IF EXISTS patient_fts")
@@ -0,0 +1,76 @@
+"""Compress patient_record notes and add notes_excerpt
+
+Revision ID: b5c8d2e7f914
+Revises: e27a4b9c1f53
+Create Date: 2026-10-18 18:02:44.310927
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from column_types import encode_text, decode_text, make_excerpt
+
+
+# revision identifiers, used by Alembic.
+revision = 'b5c8d2e7f914'
+down_revision = 'e27a4b9c1f53'
+branch_labels = None
+depends_on = None
+
+# Rows converted per round trip during the backfill
+BATCH_SIZE = 1000
+# Must match models.NOTES_EXCERPT_LENGTH
+NOTES_EXCERPT_LENGTH = 200
+
+
+def _convert(source, target, convert):
+    """Fills target from source for every row, BATCH_SIZE rows at a time in id order."""
+    connection = op.get_bind()
+    records = sa.table('patient_record', sa.column('id', sa.Integer), sa.column(source), sa.column(target),
+                       sa.column('notes_excerpt'))
+    last_id = 0
+    while True:
+        rows = connection.execute(
+            sa.select(records.c.id, records.c[source])
+            .where(records.c.id > last_id)
+            .order_by(records.c.id)
+            .limit(BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+        connection.execute(
+            records.update().where(records.c.id == sa.bindparam('record_id')),
+            [{'record_id': row.id, **convert(row[1])} for row in rows]
+        )
+        last_id = rows[-1].id
+
+
+def upgrade():
+    with op.batch_alter_table('patient_record') as batch_op:
+        batch_op.add_column(sa.Column('notes_excerpt', sa.String(length=NOTES_EXCERPT_LENGTH),
+                                      server_default='', nullable=False))
+        batch_op.add_column(sa.Column('notes_data', sa.LargeBinary(), nullable=True))
+
+    _convert('notes', 'notes_data', lambda notes: {
+        'notes_data': encode_text(notes or ''),
+        'notes_excerpt': make_excerpt(notes, NOTES_EXCERPT_LENGTH),
+    })
+
+    with op.batch_alter_table('patient_record') as batch_op:
+        batch_op.drop_column('notes')
+        batch_op.alter_column('notes_data', new_column_name='notes', nullable=False,
+                              existing_type=sa.LargeBinary())
+    if op.get_bind().dialect.name == 'postgresql':
+        # Large values are compressed already; stop TOAST from trying again
+        op.execute('ALTER TABLE patient_record ALTER COLUMN notes SET STORAGE EXTERNAL')
+
+
+def downgrade():
+    with op.batch_alter_table('patient_record') as batch_op:
+        batch_op.add_column(sa.Column('notes_text', sa.Text(), nullable=True))
+
+    _convert('notes', 'notes_text', lambda notes: {'notes_text': decode_text(notes)})
+
+    with op.batch_alter_table('patient_record') as batch_op:
+        batch_op.drop_column('notes')
+        batch_op.alter_column('notes_text', new_column_name='notes', nullable=False, existing_type=sa.Text())
+        batch_op.drop_column('notes_excerpt')
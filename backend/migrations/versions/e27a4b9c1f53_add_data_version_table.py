@@ -0,0 +1,30 @@
+"""Add data_version table
+
+Revision ID: e27a4b9c1f53
+Revises: 9b4f0c6d2e18
+Create Date: 2026-10-18 16:21:07.483915
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e27a4b9c1f53'
+down_revision = '9b4f0c6d2e18'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Rows are created on first write; a missing key reads as version 0
+    op.create_table('data_version',
+        sa.Column('key', sa.String(length=100), nullable=False),
+        sa.Column('version', sa.BigInteger(), server_default='0', nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('key')
+    )
+
+
+def downgrade():
+    op.drop_table('data_version')
@@ -1,7 +1,11 @@
 from flask_sqlalchemy import SQLAlchemy
-from werkzeug.security import generate_password_hash, check_password_hash
+from passwords import password_hasher
+from column_types import CompressedText, make_excerpt
 from datetime import datetime
 
+# Length of PatientRecord.notes_excerpt, the notes preview used by list views
+NOTES_EXCERPT_LENGTH = 200
+
 db = SQLAlchemy()
 
 class User(db.Model):
@@ -11,12 +15,16 @@ class User(db.Model):
     role = db.Column(db.String(20), nullable=False, default='secretary')  # Default role can be changed
 
     def set_password(self, password):
-        """Hashes the user's password before storing it"""
-        self.password_hash = generate_password_hash(password)
+        """Hashes the user's password before storing it (in the password hashing pool)"""
+        self.password_hash = password_hasher.hash(password)
 
     def check_password(self, password):
-        """Checks if the entered password matches the stored hash"""
-        return check_password_hash(self.password_hash, password)
+        """Checks if the entered password matches the stored hash (in the password hashing pool)"""
+        return password_hasher.verify(self.password_hash, password)
+
+    def password_needs_rehash(self):
+        """True if the stored hash uses a different method or cost than PASSWORD_HASH_METHOD"""
+        return password_hasher.needs_rehash(self.password_hash)
 
 class Patient(db.Model):
     id = db.Column(db.Integer, primary_key=True)
@@ -31,6 +39,9 @@ class Patient(db.Model):
     medical_insurance = db.Column(db.String(100), nullable=True)
     email = db.Column(db.String(120), unique=True, nullable=False)
 
+    __table_args__ = (
+        db.Index('ix_patient_last_name_id', 'last_name', 'id'),  # keyset pagination in get_patients
+    )
 
     def __repr__(self):
         return f'<Patient {self.first_name} {self.last_name}>'
@@ -44,6 +55,12 @@ class Appointment(db.Model):
 
     patient = db.relationship('Patient', backref=db.backref('appointments', lazy=True))
 
+    __table_args__ = (
+        db.Index('ix_appointment_date_time', 'appointment_date', 'appointment_time'),  # day/week views
+        db.Index('ix_appointment_doctor_date', 'doctor', 'appointment_date'),
+        db.Index('ix_appointment_patient_date', 'patient_id', 'appointment_date'),
+    )
+
     def __repr__(self):
         return f'<Appointment {self.id} for patient {self.patient_id}>'
 
@@ -51,13 +68,27 @@ class PatientRecord(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     patient_id = db.Column(db.Integer, db.ForeignKey('patient.id'), nullable=False)
     doctor = db.Column(db.String(80), nullable=False)
-    notes = db.Column(db.Text, nullable=False)
+    # Full notes are compressed and only loaded when read; lists use notes_excerpt
+    notes = db.deferred(db.Column(CompressedText(), nullable=False))
+    notes_excerpt = db.Column(db.String(NOTES_EXCERPT_LENGTH), nullable=False, server_default='')
     diagnosis = db.Column(db.String(200))
     prescription = db.Column(db.String(200))
     record_date = db.Column(db.DateTime, default=datetime.utcnow)
     updated_by = db.Column(db.String(80))  # stores who last updated the record
     updated_at = db.Column(db.DateTime)
 
+    # passive_deletes leaves deleting a patient with records to the database, as before
+    patient = db.relationship('Patient', backref=db.backref('records', lazy=True, passive_deletes=True))
+
+    __table_args__ = (
+        db.Index('ix_patient_record_patient_date', 'patient_id', 'record_date'),
+    )
+
+    @db.validates('notes')
+    def _update_notes_excerpt(self, key, notes):
+        self.notes_excerpt = make_excerpt(notes, NOTES_EXCERPT_LENGTH)
+        return notes
+
     def __repr__(self):
         return f'<PatientRecord {self.id} for patient {self.patient_id}>'
 
@@ -69,5 +100,28 @@ class Message(db.Model):
     created_at = db.Column(db.DateTime, default=datetime.utcnow)  # Timestamp of creation
     read = db.Column(db.Boolean, default=False)              # Read status
 
+    __table_args__ = (
+        db.Index('ix_message_conversation', 'sender_id', 'recipient_id', 'created_at'),  # get_messages
+    )
+
     def __repr__(self):
         return f'<Message {self.id} from {self.sender_id} to {self.recipient_id}>'
+
+class ConversationState(db.Model):
+    """Per-user view of a conversation, maintained on write by send_message and the read paths."""
+    user_id = db.Column(db.Integer, primary_key=True)        # the user this summary belongs to
+    partner_id = db.Column(db.Integer, primary_key=True)     # the other participant
+    unread_count = db.Column(db.Integer, nullable=False, default=0, server_default='0')  # unread messages from partner
+    last_message_id = db.Column(db.Integer, nullable=True)   # newest message in either direction
+
+    def __repr__(self):
+        return f'<ConversationState {self.user_id}<->{self.partner_id} unread={self.unread_count}>'
+
+class DataVersion(db.Model):
+    """Change counter per table ('patient') or row/group ('patient:42'), used for HTTP validators."""
+    key = db.Column(db.String(100), primary_key=True)
+    version = db.Column(db.BigInteger, nullable=False, default=0, server_default='0')
+    updated_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+
+    def __repr__(self):
+        return f'<DataVersion {self.key}={self.version}>'
@@ -0,0 +1,101 @@
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from flask import current_app, has_app_context
+from werkzeug.security import generate_password_hash, check_password_hash
+
+# Defaults, overridable through app.config
+DEFAULT_HASH_METHOD = 'scrypt'   # werkzeug method string, e.g. 'scrypt:16384:8:1' or 'pbkdf2:sha256:600000'
+DEFAULT_HASH_WORKERS = 2         # processes dedicated to hashing; 0 hashes inline on the request thread
+DEFAULT_HASH_MAX_PENDING = 32    # hash jobs allowed to queue before new ones are refused
+DEFAULT_HASH_TIMEOUT = 10        # seconds to wait for a queued job
+
+
+class PasswordHasherBusy(Exception):
+    """Raised when too many hash jobs are already queued, or a queued one timed out."""
+
+
+def _config(key, default):
+    if has_app_context():
+        return current_app.config.get(key, default)
+    return default
+
+
+class PasswordHasher:
+    """Runs werkzeug's deliberately slow hashing in a bounded process pool.
+
+    Keeping the work off the request threads means a burst of logins can use
+    at most PASSWORD_HASH_WORKERS cores and never holds the GIL, so other
+    requests served by the same process keep flowing. Pools are created lazily
+    and per process, so forking servers get one pool per worker.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pool = None
+        self._pid = None
+        self._pending = None
+        self._method_prefixes = {}
+
+    def _executor(self):
+        workers = _config('PASSWORD_HASH_WORKERS', DEFAULT_HASH_WORKERS)
+        if not workers:
+            return None
+        with self._lock:
+            if self._pool is None or self._pid != os.getpid():
+                # Never fork: by now this process runs threads (the log listener,
+                # request threads) whose locks a forked child could inherit held
+                methods = multiprocessing.get_all_start_methods()
+                context = multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+                self._pool = ProcessPoolExecutor(max_workers=workers, mp_context=context)
+                self._pid = os.getpid()
+                self._pending = threading.BoundedSemaphore(
+                    _config('PASSWORD_HASH_MAX_PENDING', DEFAULT_HASH_MAX_PENDING)
+                )
+            return self._pool
+
+    def _run(self, fn, *args):
+        pool = self._executor()
+        if pool is None:
+            return fn(*args)
+        if not self._pending.acquire(blocking=False):
+            raise PasswordHasherBusy('Too many password operations in progress')
+        try:
+            future = pool.submit(fn, *args)
+            try:
+                return future.result(timeout=_config('PASSWORD_HASH_TIMEOUT', DEFAULT_HASH_TIMEOUT))
+            except FutureTimeoutError:
+                future.cancel()
+                raise PasswordHasherBusy('Timed out waiting for a password operation')
+        finally:
+            self._pending.release()
+
+    @staticmethod
+    def method():
+        return _config('PASSWORD_HASH_METHOD', DEFAULT_HASH_METHOD)
+
+    def hash(self, password):
+        return self._run(generate_password_hash, password, self.method())
+
+    def verify(self, pwhash, password):
+        return self._run(check_password_hash, pwhash, password)
+
+    def needs_rehash(self, pwhash):
+        """True if pwhash was made with a different method or cost than configured."""
+        method = self.method()
+        prefix = self._method_prefixes.get(method)
+        if prefix is None:
+            # Expand shorthand like 'scrypt' to the full 'scrypt:32768:8:1' werkzeug writes
+            prefix = generate_password_hash('', method).split('$', 1)[0]
+            self._method_prefixes[method] = prefix
+        return pwhash.split('$', 1)[0] != prefix
+
+    def shutdown(self):
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=False, cancel_futures=True)
+                self._pool = None
+
+
+password_hasher = PasswordHasher()
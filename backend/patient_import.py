@@ -0,0 +1,133 @@
+import csv
+import io
+import json
+from sqlalchemy.exc import DBAPIError, IntegrityError
+from models import db, Patient
+from validation import validate_new_patient
+from versions import bump_versions
+
+DEFAULT_BATCH_SIZE = 1000
+# Row errors listed in a report; any beyond this are only counted
+MAX_REPORTED_ERRORS = 1000
+
+
+def read_csv_rows(stream):
+    """Yields (row_number, data) from a binary CSV stream with a header row.
+
+    Empty cells become None; values stay strings and are converted by validation.
+    """
+    reader = csv.DictReader(io.TextIOWrapper(stream, encoding='utf-8-sig', newline=''))
+    for row_number, row in enumerate(reader, start=1):
+        data = {key.strip(): (value.strip() or None) if isinstance(value, str) else value
+                for key, value in row.items() if key}
+        yield row_number, data
+
+
+def read_ndjson_rows(stream):
+    """Yields (row_number, data) from a binary newline-delimited JSON stream."""
+    row_number = 0
+    for line in stream:
+        line = line.strip()
+        if not line:
+            continue
+        row_number += 1
+        try:
+            data = json.loads(line)
+        except ValueError:
+            yield row_number, 'Invalid JSON'
+            continue
+        if not isinstance(data, dict):
+            yield row_number, 'Each line must be a JSON object'
+            continue
+        yield row_number, data
+
+
+class ImportReport:
+    def __init__(self):
+        self.rows = 0
+        self.imported = 0
+        self.failed = 0
+        self.errors = []
+
+    def add_error(self, row_number, error):
+        self.failed += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({'row': row_number, 'error': error})
+
+    def to_dict(self):
+        return {
+            'rows': self.rows,
+            'imported': self.imported,
+            'failed': self.failed,
+            'errors': sorted(self.errors, key=lambda e: e['row']),
+            'errors_truncated': self.failed > len(self.errors),
+        }
+
+
+def _flush(batch, report):
+    """Inserts one batch; rows whose email already exists are reported, not inserted."""
+    emails = [values['email'] for _, values in batch]
+    existing = {email for (email,) in db.session.query(Patient.email).filter(Patient.email.in_(emails))}
+    rows = []
+    for row_number, values in batch:
+        if values['email'] in existing:
+            report.add_error(row_number, 'A patient with this email already exists')
+        else:
+            rows.append((row_number, values))
+    if not rows:
+        return
+    try:
+        # One executemany round trip for the whole batch
+        db.session.execute(Patient.__table__.insert(), [values for _, values in rows])
+        # Core inserts bypass the ORM flush hook that bumps the patient list version
+        bump_versions(db.session.connection(), ['patient'])
+        db.session.commit()
+        report.imported += len(rows)
+    except DBAPIError:
+        # Lost a race with a concurrent insert, or a value the database rejects
+        # despite validation: retry row by row to isolate the culprit
+        db.session.rollback()
+        for row_number, values in rows:
+            try:
+                db.session.execute(Patient.__table__.insert(), [values])
+                bump_versions(db.session.connection(), ['patient'])
+                db.session.commit()
+                report.imported += 1
+            except IntegrityError:
+                db.session.rollback()
+                report.add_error(row_number, 'A patient with this email already exists')
+            except DBAPIError as e:
+                db.session.rollback()
+                report.add_error(row_number, f'Rejected by the database: {str(e.orig).splitlines()[0]}')
+
+
+def import_patients(rows, batch_size=DEFAULT_BATCH_SIZE):
+    """Validates and inserts patients from an iterable of (row_number, data).
+
+    Rows are validated with the add_patient rules and inserted in batches of
+    batch_size; invalid or duplicate rows are reported and skipped without
+    aborting the rest of the load. Returns an ImportReport.
+    """
+    report = ImportReport()
+    batch = []
+    seen_emails = set()
+    for row_number, data in rows:
+        report.rows += 1
+        if isinstance(data, str):
+            report.add_error(row_number, data)
+            continue
+        values, error = validate_new_patient(data)
+        if error:
+            report.add_error(row_number, error)
+            continue
+        if values['email'] in seen_emails:
+            report.add_error(row_number, 'Duplicate email in import')
+            continue
+        seen_emails.add(values['email'])
+        batch.append((row_number, values))
+        if len(batch) >= batch_size:
+            _flush(batch, report)
+            batch = []
+    if batch:
+        _flush(batch, report)
+    return report
@@ -0,0 +1,91 @@
+import re
+from sqlalchemy import DDL, event, table, column
+from models import db, Patient
+
+# Columns covered by the search index
+SEARCH_COLUMNS = ('first_name', 'last_name', 'email', 'home_phone', 'personal_phone')
+
+# PostgreSQL: pg_trgm GIN indexes serve ILIKE '%q%' and similarity ranking
+POSTGRES_DDL = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE INDEX IF NOT EXISTS ix_patient_name_trgm ON patient "
+    "USING gin ((first_name || ' ' || last_name) gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS ix_patient_email_trgm ON patient USING gin (email gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS ix_patient_home_phone_trgm ON patient USING gin (home_phone gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS ix_patient_personal_phone_trgm ON patient USING gin (personal_phone gin_trgm_ops)",
+]
+
+# SQLite (local and test runs): an external-content FTS5 table kept in sync by triggers
+_columns = ', '.join(SEARCH_COLUMNS)
+_new_values = ', '.join(f'new.{c}' for c in SEARCH_COLUMNS)
+_old_values = ', '.join(f'old.{c}' for c in SEARCH_COLUMNS)
+SQLITE_DDL = [
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS patient_fts USING fts5({_columns}, content='patient', content_rowid='id')",
+    f"CREATE TRIGGER IF NOT EXISTS patient_fts_ai AFTER INSERT ON patient BEGIN "
+    f"INSERT INTO patient_fts(rowid, {_columns}) VALUES (new.id, {_new_values}); END",
+    f"CREATE TRIGGER IF NOT EXISTS patient_fts_ad AFTER DELETE ON patient BEGIN "
+    f"INSERT INTO patient_fts(patient_fts, rowid, {_columns}) VALUES ('delete', old.id, {_old_values}); END",
+    f"CREATE TRIGGER IF NOT EXISTS patient_fts_au AFTER UPDATE ON patient BEGIN "
+    f"INSERT INTO patient_fts(patient_fts, rowid, {_columns}) VALUES ('delete', old.id, {_old_values}); "
+    f"INSERT INTO patient_fts(rowid, {_columns}) VALUES (new.id, {_new_values}); END",
+    "INSERT INTO patient_fts(patient_fts) VALUES ('rebuild')",
+]
+
+# Create the search index alongside the patient table (db.create_all and test databases)
+for _statement in POSTGRES_DDL:
+    event.listen(Patient.__table__, 'after_create', DDL(_statement).execute_if(dialect='postgresql'))
+for _statement in SQLITE_DDL:
+    event.listen(Patient.__table__, 'after_create', DDL(_statement).execute_if(dialect='sqlite'))
+event.listen(Patient.__table__, 'before_drop',
+             DDL("DROP TABLE IF EXISTS patient_fts").execute_if(dialect='sqlite'))
+
+_fts = table('patient_fts', column('rowid'), column('rank'))
+
+
+def _escape_like(value):
+    return value.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+
+
+def _fts_query(q):
+    # Every word must match as a prefix: "ann smi" -> "ann"* "smi"*
+    terms = re.findall(r'\w+', q)
+    return ' '.join(f'"{term}"*' for term in terms)
+
+
+def search_patients_query(q, limit):
+    """Returns a ranked Patient query for q using the best index the database offers."""
+    dialect = db.session.get_bind().dialect.name
+
+    if dialect == 'sqlite':
+        match = _fts_query(q)
+        if not match:
+            return None
+        return Patient.query.join(_fts, _fts.c.rowid == Patient.id).filter(
+            db.text('patient_fts MATCH :match').bindparams(match=match)
+        ).order_by(_fts.c.rank, Patient.id).limit(limit)
+
+    pattern = '%' + _escape_like(q) + '%'
+    if dialect == 'postgresql':
+        # Must match the indexed expression exactly, so the separator is a literal
+        name = Patient.first_name.op('||')(db.literal_column("' '")).op('||')(Patient.last_name)
+        rank = db.func.greatest(
+            db.func.similarity(name, q),
+            db.func.similarity(Patient.email, q),
+            db.func.similarity(db.func.coalesce(Patient.home_phone, ''), q),
+            db.func.similarity(db.func.coalesce(Patient.personal_phone, ''), q),
+        )
+    else:
+        name = Patient.first_name + ' ' + Patient.last_name
+        rank = None
+
+    query = Patient.query.filter(
+        name.ilike(pattern, escape='\\') |
+        Patient.email.ilike(pattern, escape='\\') |
+        Patient.home_phone.ilike(pattern, escape='\\') |
+        Patient.personal_phone.ilike(pattern, escape='\\')
+    )
+    if rank is not None:
+        query = query.order_by(rank.desc(), Patient.id)
+    else:
+        query = query.order_by(Patient.last_name, Patient.id)
+    return query.limit(limit)
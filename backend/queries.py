@@ -0,0 +1,107 @@
+from sqlalchemy import DDL, event
+from models import db, Patient, Appointment, PatientRecord, Message
+from serializers import patient_serializer, appointment_serializer
+
+# Query builders shared by the endpoints and the query plan check, so the
+# statements that are EXPLAINed are the ones the endpoints actually run.
+
+# Case-insensitive name prefix filter of get_patients: one expression index
+# per name column. PostgreSQL compares in the "C" collation so that a prefix
+# is one contiguous index range whatever the database's collation is.
+NAME_PREFIX_COLUMNS = ('first_name', 'last_name')
+for _column in NAME_PREFIX_COLUMNS:
+    event.listen(Patient.__table__, 'after_create', DDL(
+        f'CREATE INDEX IF NOT EXISTS ix_patient_{_column}_lower ON patient (lower({_column}) COLLATE "C")'
+    ).execute_if(dialect='postgresql'))
+    event.listen(Patient.__table__, 'after_create', DDL(
+        f'CREATE INDEX IF NOT EXISTS ix_patient_{_column}_lower ON patient (lower({_column}))'
+    ).execute_if(dialect='sqlite'))
+
+
+def escape_like(value):
+    """Escapes LIKE wildcards in user input."""
+    return value.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+
+
+def name_prefix_filter(prefix):
+    """Patients whose first or last name starts with prefix, ignoring case.
+
+    Written as a range on lower(name) rather than ILIKE so each side of the
+    OR is served by its ix_patient_*_lower index on both databases.
+    """
+    postgresql = db.session.get_bind().dialect.name == 'postgresql'
+    # SQLite's lower() folds ASCII letters only; fold the prefix the same way
+    low = prefix.lower() if postgresql else ''.join(c.lower() if c.isascii() else c for c in prefix)
+    high = low[:-1] + chr(ord(low[-1]) + 1)
+    conditions = []
+    for name in NAME_PREFIX_COLUMNS:
+        expression = db.func.lower(getattr(Patient, name))
+        if postgresql:
+            expression = expression.collate('C')
+        conditions.append((expression >= low) & (expression < high))
+    return db.or_(*conditions)
+
+
+def patients_page_query(limit, fields=None, name=None, insurance=None, birth_from=None, birth_to=None,
+                        after=None):
+    """One keyset page of patients ordered by (last_name, id), plus one extra row.
+
+    after is the (last_name, id) of the previous page's last row. Only the
+    requested columns are loaded; the sort key is always needed for the cursor.
+    """
+    query = Patient.query.options(patient_serializer.load_options(fields, required=('id', 'last_name')))
+    if name:
+        query = query.filter(name_prefix_filter(name))
+    if insurance:
+        query = query.filter(Patient.medical_insurance == insurance)
+    if birth_from:
+        query = query.filter(Patient.birth_date >= birth_from)
+    if birth_to:
+        query = query.filter(Patient.birth_date <= birth_to)
+    if after:
+        query = query.filter(db.tuple_(Patient.last_name, Patient.id) > tuple(after))
+    return query.order_by(Patient.last_name.asc(), Patient.id.asc()).limit(limit + 1)
+
+
+def appointments_query(fields=None, date_from=None, date_to=None, doctor=None, patient_id=None,
+                       patient_name=None):
+    """Appointments matching the filters in date and time order.
+
+    Patient is loaded through the same join so building patient_name does not
+    issue one extra query per appointment.
+    """
+    query = Appointment.query.join(Appointment.patient).options(
+        appointment_serializer.load_options(fields),
+        db.contains_eager(Appointment.patient).load_only(Patient.first_name, Patient.last_name)
+    )
+    if date_from:
+        query = query.filter(Appointment.appointment_date >= date_from)
+    if date_to:
+        query = query.filter(Appointment.appointment_date <= date_to)
+    if doctor:
+        query = query.filter(Appointment.doctor == doctor)
+    if patient_id:
+        query = query.filter(Appointment.patient_id == patient_id)
+    if patient_name:
+        prefix = escape_like(patient_name) + '%'
+        query = query.filter(
+            Patient.first_name.ilike(prefix, escape='\\') | Patient.last_name.ilike(prefix, escape='\\')
+        )
+    return query.order_by(Appointment.appointment_date.asc(), Appointment.appointment_time.asc())
+
+
+def patient_records_query(patient_id):
+    return PatientRecord.query.filter_by(patient_id=patient_id)
+
+
+def conversation_query(user_id, partner_id, since_id=None, since=None):
+    """Messages between two users, oldest first, optionally only those after since_id / since."""
+    query = Message.query.filter(
+        ((Message.sender_id == user_id) & (Message.recipient_id == partner_id)) |
+        ((Message.sender_id == partner_id) & (Message.recipient_id == user_id))
+    )
+    if since_id:
+        query = query.filter(Message.id > since_id)
+    if since:
+        query = query.filter(Message.created_at > since)
+    return query.order_by(Message.created_at.asc(), Message.id.asc())
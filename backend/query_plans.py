@@ -0,0 +1,54 @@
+from datetime import date, timedelta
+from models import db
+from queries import appointments_query, conversation_query, patient_records_query, patients_page_query
+
+
+def hot_queries():
+    """Returns the queries behind the busiest endpoints, keyed by name.
+
+    They come from the same builders get_patients, get_appointments,
+    get_patient_records and get_messages use, with representative parameters.
+    """
+    today = date.today()
+    return {
+        'get_patients (next page)': patients_page_query(50, after=('M', 0)),
+        'get_patients (name filter)': patients_page_query(50, name='Smi'),
+        'get_appointments (week view)': appointments_query(date_from=today, date_to=today + timedelta(days=7)),
+        'get_appointments (doctor day)': appointments_query(doctor='doctor', date_from=today, date_to=today),
+        'get_appointments (patient)': appointments_query(patient_id=1, date_from=today),
+        'get_patient_records': patient_records_query(1),
+        'get_messages': conversation_query(1, 2),
+        'get_messages (since_id)': conversation_query(1, 2, since_id=1),
+    }
+
+
+def explain(query):
+    """Runs EXPLAIN for an ORM query and returns the plan as a list of lines."""
+    engine = db.engine
+    compiled = query.statement.compile(dialect=engine.dialect)
+    params = compiled.construct_params()
+    if compiled.positional:
+        params = tuple(params[name] for name in compiled.positiontup)
+
+    with engine.connect() as conn:
+        if engine.dialect.name == 'postgresql':
+            rows = conn.exec_driver_sql('EXPLAIN ' + compiled.string, params).fetchall()
+            return [row[0] for row in rows]
+        rows = conn.exec_driver_sql('EXPLAIN QUERY PLAN ' + compiled.string, params).fetchall()
+        return [row[-1] for row in rows]
+
+
+def is_sequential_scan(line):
+    if 'Seq Scan' in line:
+        return True
+    # SQLite reports full table scans as "SCAN <table>" without an index
+    return line.startswith('SCAN ') and 'USING' not in line
+
+
+def check_plans():
+    """Explains every hot query and returns {name: (plan_lines, regressed)}."""
+    results = {}
+    for name, query in hot_queries().items():
+        plan = explain(query)
+        results[name] = (plan, any(is_sequential_scan(line.strip()) for line in plan))
+    return results
@@ -0,0 +1,212 @@
+import logging
+import re
+import threading
+import time
+from collections import Counter
+from flask import current_app, g, has_request_context, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SQL_REPEAT_THRESHOLD = 10  # same statement shape more often than this in one request is logged
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+SQL_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+# Expanded IN lists and VALUES rows differ only in the number of placeholders
+_PLACEHOLDER_LIST = re.compile(r'\(\s*(\?|%\(\w+\)s|%s|:\w+)(\s*,\s*(\?|%\(\w+\)s|%s|:\w+))+\s*\)')
+_WHITESPACE = re.compile(r'\s+')
+
+
+def statement_shape(statement):
+    return _PLACEHOLDER_LIST.sub('(?)', _WHITESPACE.sub(' ', statement).strip())
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(names, values, extra=()):
+    pairs = list(zip(names, values)) + list(extra)
+    if not pairs:
+        return ''
+    return '{' + ','.join(f'{name}="{_escape(value)}"' for name, value in pairs) + '}'
+
+
+def _format_value(value):
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class CounterMetric:
+    """Monotonic counter with labels, in Prometheus text format."""
+
+    kind = 'counter'
+
+    def __init__(self, name, documentation, labels=()):
+        self.name = name
+        self.documentation = documentation
+        self.labels = tuple(labels)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *label_values, amount=1):
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0) + amount
+
+    def samples(self):
+        with self._lock:
+            items = sorted(self._values.items())
+        for label_values, value in items:
+            yield self.name, _format_labels(self.labels, label_values), value
+
+
+class HistogramMetric:
+    """Cumulative-bucket histogram with labels, in Prometheus text format."""
+
+    kind = 'histogram'
+
+    def __init__(self, name, documentation, labels=(), buckets=LATENCY_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labels = tuple(labels)
+        self.buckets = tuple(buckets)
+        self._series = {}  # label values -> [bucket counts..., +Inf count, sum]
+        self._lock = threading.Lock()
+
+    def observe(self, value, *label_values):
+        with self._lock:
+            series = self._series.get(label_values)
+            if series is None:
+                series = self._series[label_values] = [0] * (len(self.buckets) + 1) + [0.0]
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[index] += 1
+            series[len(self.buckets)] += 1
+            series[-1] += value
+
+    def samples(self):
+        with self._lock:
+            items = sorted((key, list(series)) for key, series in self._series.items())
+        for label_values, series in items:
+            for bound, count in zip(self.buckets, series):
+                yield (f'{self.name}_bucket',
+                       _format_labels(self.labels, label_values, [('le', _format_value(bound))]), count)
+            yield f'{self.name}_bucket', _format_labels(self.labels, label_values, [('le', '+Inf')]), series[-2]
+            yield f'{self.name}_sum', _format_labels(self.labels, label_values), series[-1]
+            yield f'{self.name}_count', _format_labels(self.labels, label_values), series[-2]
+
+
+class CallbackMetric:
+    """Gauge (or counter kept elsewhere) whose samples are read from a callback at scrape time."""
+
+    def __init__(self, name, documentation, collect, labels=(), kind='gauge'):
+        self.kind = kind
+        self.name = name
+        self.documentation = documentation
+        self.labels = tuple(labels)
+        self._collect = collect  # () -> iterable of (label_values, value)
+
+    def samples(self):
+        for label_values, value in self._collect():
+            yield self.name, _format_labels(self.labels, label_values), value
+
+
+class Registry:
+    def __init__(self):
+        self.metrics = []
+
+    def register(self, metric):
+        self.metrics.append(metric)
+        return metric
+
+    def render(self):
+        lines = []
+        for metric in self.metrics:
+            lines.append(f'# HELP {metric.name} {metric.documentation}')
+            lines.append(f'# TYPE {metric.name} {metric.kind}')
+            for name, labels, value in metric.samples():
+                lines.append(f'{name}{labels} {_format_value(value)}')
+        return '\n'.join(lines) + '\n'
+
+
+registry = Registry()
+
+REQUESTS = registry.register(CounterMetric(
+    'http_requests_total', 'HTTP requests by endpoint and status.', ('method', 'endpoint', 'status')))
+LATENCY = registry.register(HistogramMetric(
+    'http_request_duration_seconds', 'Time to build the response.', ('method', 'endpoint')))
+SQL_QUERIES = registry.register(HistogramMetric(
+    'http_request_sql_queries', 'SQL statements executed per request.', ('method', 'endpoint'),
+    buckets=SQL_COUNT_BUCKETS))
+SQL_DURATION = registry.register(HistogramMetric(
+    'http_request_sql_duration_seconds', 'Time spent executing SQL per request.', ('method', 'endpoint')))
+RESPONSE_SIZE = registry.register(HistogramMetric(
+    'http_response_size_bytes', 'Response body size, for responses of known length.', ('method', 'endpoint'),
+    buckets=SIZE_BUCKETS))
+REPEATED_SQL = registry.register(CounterMetric(
+    'http_request_repeated_sql_total', 'Requests that repeated one statement shape past the threshold.',
+    ('method', 'endpoint')))
+
+
+@event.listens_for(Engine, 'before_cursor_execute')
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if has_request_context():
+        conn.info.setdefault('query_started', []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, 'after_cursor_execute')
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if not has_request_context():
+        return
+    started = conn.info.get('query_started')
+    if not started:
+        return
+    elapsed = time.perf_counter() - started.pop()
+    stats = g.get('sql_stats')
+    if stats is not None:
+        stats['count'] += 1
+        stats['time'] += elapsed
+        stats['shapes'][statement] += 1
+
+
+def _endpoint_label():
+    # The URL rule keeps the label set bounded (/api/patients/<int:patient_id>)
+    return request.url_rule.rule if request.url_rule else 'unmatched'
+
+
+def _before_request():
+    g.request_started = time.perf_counter()
+    g.sql_stats = {'count': 0, 'time': 0.0, 'shapes': Counter()}
+
+
+def _after_request(response):
+    started = g.get('request_started')
+    stats = g.get('sql_stats')
+    if started is None or stats is None:
+        return response
+    method, endpoint = request.method, _endpoint_label()
+    REQUESTS.inc(method, endpoint, str(response.status_code))
+    LATENCY.observe(time.perf_counter() - started, method, endpoint)
+    SQL_QUERIES.observe(stats['count'], method, endpoint)
+    SQL_DURATION.observe(stats['time'], method, endpoint)
+    if response.content_length is not None:
+        RESPONSE_SIZE.observe(response.content_length, method, endpoint)
+
+    threshold = current_app.config.get('SQL_REPEAT_THRESHOLD', DEFAULT_SQL_REPEAT_THRESHOLD)
+    repeated = Counter()
+    for statement, count in stats['shapes'].items():
+        repeated[statement_shape(statement)] += count
+    worst = [(shape, count) for shape, count in repeated.most_common(3) if count > threshold]
+    if worst:
+        REPEATED_SQL.inc(method, endpoint)
+        for shape, count in worst:
+            logger.warning('Possible N+1: %s %s ran the same statement %d times: %s',
+                           method, endpoint, count, shape[:300])
+    return response
+
+
+def init_app(app):
+    app.before_request(_before_request)
+    app.after_request(_after_request)
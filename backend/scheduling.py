@@ -0,0 +1,221 @@
+import bisect
+import threading
+import time as _time
+import zlib
+from datetime import datetime, time, timedelta
+from flask import current_app
+from models import db, Appointment
+
+DEFAULT_SLOT_MINUTES = 30
+# weekday (0 = Monday) -> list of (start, end) "HH:MM" intervals
+DEFAULT_WORKING_HOURS = {day: [('09:00', '17:00')] for day in range(5)}
+DEFAULT_BOOKING_INDEX_TTL = 60  # seconds a cached doctor/day bucket is trusted for availability queries
+# Recurrence frequency -> days per interval
+RECURRENCE_STEPS = {'daily': 1, 'weekly': 7}
+
+
+def slot_minutes():
+    return current_app.config.get('APPOINTMENT_SLOT_MINUTES', DEFAULT_SLOT_MINUTES)
+
+
+def working_hours(doctor, day):
+    """Working intervals for doctor on day, in minutes since midnight."""
+    overrides = current_app.config.get('DOCTOR_WORKING_HOURS_OVERRIDES', {})
+    hours = overrides.get(doctor) or current_app.config.get('DOCTOR_WORKING_HOURS', DEFAULT_WORKING_HOURS)
+    intervals = hours.get(day.weekday(), hours.get(str(day.weekday()), []))
+    return [(_minutes(time.fromisoformat(start)), _minutes(time.fromisoformat(end))) for start, end in intervals]
+
+
+def _minutes(value):
+    return value.hour * 60 + value.minute
+
+
+def _format_minutes(minutes):
+    return f'{minutes // 60:02d}:{minutes % 60:02d}'
+
+
+class BookingIndex:
+    """Per-process interval index of booked appointments, bucketed by (doctor, day).
+
+    Each bucket is a sorted list of (start_minute, end_minute, appointment_id)
+    loaded with one lookup on ix_appointment_doctor_date. Availability queries
+    are answered from cached buckets; bookings re-read their bucket under a
+    per-doctor/day lock so concurrent workers cannot double-book.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._buckets = {}  # (doctor, day) -> (loaded_at, [(start, end, id), ...])
+
+    def _ttl(self):
+        return current_app.config.get('BOOKING_INDEX_TTL', DEFAULT_BOOKING_INDEX_TTL)
+
+    def load(self, doctor, start_day, end_day, refresh=False):
+        """Returns {day: intervals} for doctor between start_day and end_day inclusive."""
+        now = _time.monotonic()
+        ttl = self._ttl()
+        days = [start_day + timedelta(days=i) for i in range((end_day - start_day).days + 1)]
+        result, missing = {}, []
+        with self._lock:
+            for day in days:
+                entry = self._buckets.get((doctor, day))
+                if entry and not refresh and now - entry[0] < ttl:
+                    result[day] = entry[1]
+                else:
+                    missing.append(day)
+        if not missing:
+            return result
+
+        # One indexed range query covers every day that needs loading
+        loaded = {day: [] for day in missing}
+        length = slot_minutes()
+        rows = db.session.query(
+            Appointment.id, Appointment.appointment_date, Appointment.appointment_time
+        ).filter(
+            Appointment.doctor == doctor,
+            Appointment.appointment_date >= missing[0],
+            Appointment.appointment_date <= missing[-1]
+        )
+        for appointment_id, day, start in rows:
+            if day in loaded:
+                begin = _minutes(start)
+                loaded[day].append((begin, begin + length, appointment_id))
+        with self._lock:
+            for day, intervals in loaded.items():
+                intervals.sort()
+                self._buckets[(doctor, day)] = (now, intervals)
+                result[day] = intervals
+        return result
+
+    def invalidate(self, doctor, day):
+        with self._lock:
+            self._buckets.pop((doctor, day), None)
+
+    def clear(self):
+        with self._lock:
+            self._buckets.clear()
+
+
+booking_index = BookingIndex()
+
+
+def _overlapping(intervals, start, end, ignore_id=None):
+    # Every interval has the same length, so only those starting within one
+    # length before `start` and before `end` can overlap
+    position = bisect.bisect_left(intervals, (start - (end - start) + 1,))
+    for begin, finish, appointment_id in intervals[position:]:
+        if begin >= end:
+            break
+        if appointment_id != ignore_id:
+            return appointment_id
+    return None
+
+
+def lock_doctor_day(doctor, day):
+    """Serializes bookings for one doctor and day until the transaction ends (PostgreSQL)."""
+    if db.session.get_bind().dialect.name == 'postgresql':
+        key = zlib.crc32(f'{doctor}|{day.isoformat()}'.encode())
+        db.session.execute(db.text('SELECT pg_advisory_xact_lock(:key)'), {'key': key})
+
+
+def find_conflict(doctor, day, start_time, ignore_id=None):
+    """Returns the id of an appointment overlapping the slot, or None.
+
+    Must be called inside the transaction that books the slot.
+    """
+    lock_doctor_day(doctor, day)
+    intervals = booking_index.load(doctor, day, day, refresh=True)[day]
+    start = _minutes(start_time)
+    return _overlapping(intervals, start, start + slot_minutes(), ignore_id)
+
+
+def find_series_conflicts(slots):
+    """Checks a series of (doctor, day, start_time) slots in one pass.
+
+    Returns [(index, conflict)] where conflict is ('appointment', id) for an
+    existing booking or ('series', index) for an earlier slot of the same
+    series. Like find_conflict, it must run inside the booking transaction;
+    every doctor/day the series touches is locked first, in a fixed order so
+    two overlapping series cannot deadlock.
+    """
+    for doctor, day in sorted({(doctor, day) for doctor, day, _ in slots}):
+        lock_doctor_day(doctor, day)
+    # One range load per doctor covers every day of their part of the series
+    booked = {}
+    for doctor in {doctor for doctor, _, _ in slots}:
+        days = [day for d, day, _ in slots if d == doctor]
+        for day, intervals in booking_index.load(doctor, min(days), max(days), refresh=True).items():
+            booked[(doctor, day)] = intervals
+
+    length = slot_minutes()
+    accepted = {}  # (doctor, day) -> sorted [(start, end, -(index + 1))] of this series
+    conflicts = []
+    for index, (doctor, day, start_time) in enumerate(slots):
+        start = _minutes(start_time)
+        existing = _overlapping(booked.get((doctor, day), []), start, start + length)
+        if existing is not None:
+            conflicts.append((index, ('appointment', existing)))
+            continue
+        ours = accepted.setdefault((doctor, day), [])
+        # Series slots carry negative ids so they never collide with real ones
+        earlier = _overlapping(ours, start, start + length)
+        if earlier is not None:
+            conflicts.append((index, ('series', -earlier - 1)))
+            continue
+        bisect.insort(ours, (start, start + length, -(index + 1)))
+    return conflicts
+
+
+def expand_recurrence(start_day, frequency, interval=1, until=None, count=None, limit=None):
+    """Dates of a recurring series: every `interval` days or weeks from start_day.
+
+    The series ends at `until` (inclusive) or after `count` dates, whichever
+    is given; raises ValueError if it would produce more than `limit` dates.
+    """
+    if not isinstance(frequency, str) or frequency not in RECURRENCE_STEPS:
+        raise ValueError(f"frequency must be one of: {', '.join(RECURRENCE_STEPS)}")
+    # bool is a subclass of int, but true is not a count
+    if isinstance(interval, bool) or not isinstance(interval, int) or interval < 1:
+        raise ValueError('interval must be a positive integer')
+    if (until is None) == (count is None):
+        raise ValueError("Give exactly one of 'until' or 'count'")
+    if count is not None and (isinstance(count, bool) or not isinstance(count, int) or count < 1):
+        raise ValueError('count must be a positive integer')
+    if until is not None and until < start_day:
+        raise ValueError("'until' must not be before the start date")
+
+    step = timedelta(days=RECURRENCE_STEPS[frequency] * interval)
+    if count is None:
+        count = (until - start_day) // step + 1
+    if limit is not None and count > limit:
+        raise ValueError(f'A series may not have more than {limit} appointments')
+    return [start_day + step * n for n in range(count)]
+
+
+def free_slots(doctor, start_day, end_day):
+    """Free slot start times per day, within the doctor's working hours."""
+    length = slot_minutes()
+    booked = booking_index.load(doctor, start_day, end_day)
+    days = []
+    for day in sorted(booked):
+        free = []
+        for begin, finish in working_hours(doctor, day):
+            for slot in range(begin, finish - length + 1, length):
+                if _overlapping(booked[day], slot, slot + length) is None:
+                    free.append(_format_minutes(slot))
+        days.append({'date': day.isoformat(), 'free': free})
+    return days
+
+
+def parse_appointment_time(value):
+    """Parses "HH:MM" or "HH:MM:SS"; raises ValueError."""
+    if not isinstance(value, str):
+        raise ValueError('Invalid appointment_time')
+    return time.fromisoformat(value)
+
+
+def parse_appointment_date(value):
+    """Parses "YYYY-MM-DD"; raises ValueError."""
+    if not isinstance(value, str):
+        raise ValueError('Invalid appointment_date')
+    return datetime.strptime(value, '%Y-%m-%d').date()
@@ -0,0 +1,114 @@
+from datetime import date, datetime, time
+from flask import Response, json
+from sqlalchemy import inspect
+from sqlalchemy.orm import load_only
+from models import Patient, Appointment, PatientRecord, Message
+
+# orjson is several times faster than the stdlib encoder; use it when installed
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+def _isoformat(value):
+    return value.isoformat() if value is not None else None
+
+
+class ModelSerializer:
+    """Turns model instances into dicts using a function compiled per field set.
+
+    Fields default to every column of the model, in declaration order, plus any
+    computed `extra` fields (name -> callable taking the instance). Deferred
+    columns are left out of the default and only dumped when asked for by name.
+    Date, time and datetime columns are rendered as ISO 8601 strings.
+    """
+
+    def __init__(self, model, extra=None, exclude=()):
+        self.model = model
+        self.extra = dict(extra or {})
+        self.columns = {
+            attr.key: attr for attr in inspect(model).column_attrs if attr.key not in exclude
+        }
+        self.fields = tuple(self.columns) + tuple(self.extra)
+        self.default_fields = tuple(
+            name for name in self.fields if name not in self.columns or not self.columns[name].deferred
+        )
+        self._compiled = {}
+
+    def parse_fields(self, value):
+        """Parses a ?fields=a,b,c argument; returns None for the default fields."""
+        if not value:
+            return None
+        fields = tuple(dict.fromkeys(f.strip() for f in value.split(',') if f.strip()))
+        unknown = [f for f in fields if f not in self.fields]
+        if unknown:
+            raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+        return fields
+
+    def load_options(self, fields, required=()):
+        """Loader option restricting the SELECT to the columns behind `fields`."""
+        if fields is None:
+            return load_only(*[getattr(self.model, key) for key in self.columns if key in self.default_fields])
+        required = set(required) | {column.key for column in inspect(self.model).primary_key}
+        keys = [key for key in self.columns if key in fields or key in required]
+        return load_only(*[getattr(self.model, key) for key in keys])
+
+    def _compile(self, fields):
+        # Generate a straight-line function building the dict literal; this avoids
+        # per-field loops and lookups when serializing long lists.
+        namespace = {'_iso': _isoformat, '_extra': self.extra}
+        items = []
+        for name in fields:
+            if name in self.extra:
+                items.append(f"{name!r}: _extra[{name!r}](obj)")
+                continue
+            python_type = None
+            try:
+                python_type = self.columns[name].columns[0].type.python_type
+            except NotImplementedError:
+                pass
+            if python_type in (date, datetime, time):
+                items.append(f"{name!r}: _iso(obj.{name})")
+            else:
+                items.append(f"{name!r}: obj.{name}")
+        source = "def serialize(obj):\n    return {" + ", ".join(items) + "}\n"
+        exec(compile(source, f"<serializer {self.model.__name__}>", 'exec'), namespace)
+        return namespace['serialize']
+
+    def _get(self, fields):
+        fields = self.default_fields if fields is None else fields
+        serialize = self._compiled.get(fields)
+        if serialize is None:
+            serialize = self._compiled[fields] = self._compile(fields)
+        return serialize
+
+    def dump(self, obj, fields=None):
+        return self._get(fields)(obj)
+
+    def dump_many(self, objs, fields=None):
+        serialize = self._get(fields)
+        return [serialize(obj) for obj in objs]
+
+
+def _patient_name(appointment):
+    patient = appointment.patient
+    return f"{patient.first_name} {patient.last_name}" if patient else ""
+
+
+patient_serializer = ModelSerializer(Patient)
+appointment_serializer = ModelSerializer(Appointment, extra={'patient_name': _patient_name})
+patient_record_serializer = ModelSerializer(PatientRecord)
+message_serializer = ModelSerializer(Message)
+
+
+def encode_json(payload):
+    """Encodes payload to JSON bytes, with orjson when it is available."""
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(payload).encode()
+
+
+def json_response(payload, status=200):
+    """Like jsonify, but encodes with orjson when it is available."""
+    return Response(encode_json(payload), status=status, mimetype='application/json')
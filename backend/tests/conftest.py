@@ -0,0 +1,42 @@
+import os
+import sys
+import pytest
+
+# The backend is a flat set of modules run from backend/
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from flask_jwt_extended import create_access_token  # noqa: E402
+from app import create_app  # noqa: E402
+from models import db, User  # noqa: E402
+
+
+@pytest.fixture
+def app(tmp_path):
+    app = create_app({
+        'SQLALCHEMY_DATABASE_URI': f"sqlite:///{tmp_path / 'test.db'}",
+        'LOG_LEVEL': 'WARNING',
+        'PASSWORD_HASH_WORKERS': 0,
+    })
+    with app.app_context():
+        db.create_all()
+        yield app
+        db.session.remove()
+        db.engine.dispose()
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+@pytest.fixture
+def make_user(app):
+    """Creates a user and returns (user id, Authorization headers for them)."""
+    def make(username, role='doctor'):
+        user = User(username=username, role=role)
+        user.set_password('password')
+        db.session.add(user)
+        db.session.commit()
+        token = create_access_token(identity=username, additional_claims={'role': role, 'user_id': user.id})
+        return user.id, {'Authorization': f'Bearer {token}'}
+    return make
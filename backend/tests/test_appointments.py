@@ -0,0 +1,21 @@
+import pytest
+from models import db, Patient, Appointment
+
+
+@pytest.mark.parametrize('rule, error', [
+    ({'count': True}, 'count must be a positive integer'),
+    ({'count': False}, 'count must be a positive integer'),
+    ({'count': 2, 'interval': True}, 'interval must be a positive integer'),
+    ({'count': 2, 'frequency': ['weekly']}, 'frequency must be one of: daily, weekly'),
+])
+def test_recurrence_rejects_non_integer_values(client, make_user, rule, error):
+    _, headers = make_user('doc')
+    patient = Patient(first_name='Ada', last_name='Lovelace', email='ada@example.com')
+    db.session.add(patient)
+    db.session.commit()
+    body = {'patient_id': patient.id, 'doctor': 'doc',
+            'recurrence': {'start_date': '2030-01-07', 'appointment_time': '10:00', **rule}}
+    response = client.post('/api/appointments/bulk', json=body, headers=headers)
+    assert response.status_code == 400
+    assert response.get_json() == {'error': error}
+    assert db.session.query(Appointment).count() == 0
@@ -0,0 +1,34 @@
+from datetime import date, datetime, time
+import pytest
+from app import appointment_status_expr
+from models import db, Patient, Appointment
+
+DAY = date(2026, 3, 10)
+
+
+@pytest.fixture
+def appointments(app):
+    patient = Patient(first_name='Ada', last_name='Lovelace', email='ada@example.com')
+    db.session.add(patient)
+    db.session.flush()
+    for start in (time(0, 0), time(0, 20), time(9, 30), time(10, 0), time(10, 30)):
+        db.session.add(Appointment(patient_id=patient.id, doctor='doc', appointment_date=DAY, appointment_time=start))
+    db.session.commit()
+
+
+def statuses(now):
+    status = appointment_status_expr(DAY, now)
+    rows = db.session.query(Appointment.appointment_time, status).order_by(Appointment.appointment_time)
+    return {start.strftime('%H:%M'): value for start, value in rows}
+
+
+@pytest.mark.parametrize('now, expected', [
+    # Just after midnight the 00:00 slot is running even though its window began yesterday
+    (datetime(2026, 3, 10, 0, 10), {'00:00': 'in_progress', '00:20': 'upcoming'}),
+    (datetime(2026, 3, 10, 0, 0), {'00:00': 'in_progress', '00:20': 'upcoming'}),
+    (datetime(2026, 3, 10, 10, 10), {'00:20': 'completed', '09:30': 'completed', '10:00': 'in_progress',
+                                     '10:30': 'upcoming'}),
+])
+def test_appointment_status(appointments, now, expected):
+    result = statuses(now)
+    assert {start: result[start] for start in expected} == expected
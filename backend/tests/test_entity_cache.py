@@ -0,0 +1,148 @@
+import socket
+import socketserver
+import threading
+import time
+import pytest
+from flask import g
+from sqlalchemy import event
+from entity_cache import EntityCache, RedisBackend
+from models import db, Patient, PatientRecord
+
+
+class RespHandler(socketserver.StreamRequestHandler):
+    """Just enough of the Redis protocol for RedisBackend: AUTH, SELECT, GET, SET PX, FLUSHDB."""
+
+    def handle(self):
+        server = self.server
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            args = []
+            for _ in range(int(line[1:])):
+                length = int(self.rfile.readline()[1:])
+                args.append(self.rfile.read(length + 2)[:-2])
+            command = args[0].upper()
+            server.commands.append(command)
+            if command == b'GET':
+                entry = server.store.get(args[1])
+                if entry and entry[0] > time.monotonic():
+                    self.wfile.write(b'$%d\r\n%s\r\n' % (len(entry[1]), entry[1]))
+                else:
+                    self.wfile.write(b'$-1\r\n')
+            elif command == b'SET':
+                server.store[args[1]] = (time.monotonic() + int(args[4]) / 1000, args[2])
+                self.wfile.write(b'+OK\r\n')
+            elif command == b'AUTH':
+                self.wfile.write(b'+OK\r\n' if args[1] == b'secret' else b'-WRONGPASS invalid password\r\n')
+            elif command in (b'SELECT', b'FLUSHDB'):
+                if command == b'FLUSHDB':
+                    server.store.clear()
+                self.wfile.write(b'+OK\r\n')
+            else:
+                self.wfile.write(b'-ERR unknown command\r\n')
+
+
+@pytest.fixture
+def resp_server():
+    server = socketserver.ThreadingTCPServer(('127.0.0.1', 0), RespHandler)
+    server.daemon_threads = True
+    server.store = {}
+    server.commands = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def add_patient(first_name='Ada'):
+    patient = Patient(first_name=first_name, last_name='Lovelace', email=f'{first_name.lower()}@example.com')
+    db.session.add(patient)
+    db.session.commit()
+    return patient.id
+
+
+def load_first_name(patient_id):
+    return lambda: {'first_name': db.session.get(Patient, patient_id).first_name}
+
+
+def test_redis_backend_round_trip(resp_server):
+    port = resp_server.server_address[1]
+    backend = RedisBackend(f'redis://:secret@127.0.0.1:{port}/2')
+    assert backend.get('missing') is None
+    backend.set('key', b'\x00value\r\n', 60)
+    assert backend.get('key') == b'\x00value\r\n'
+    assert resp_server.commands[:2] == [b'AUTH', b'SELECT']
+
+
+def test_redis_backend_expires_entries(resp_server):
+    backend = RedisBackend(f'redis://127.0.0.1:{resp_server.server_address[1]}')
+    backend.set('key', b'value', 0.05)
+    time.sleep(0.1)
+    assert backend.get('key') is None
+
+
+def test_redis_backend_reconnects_after_failure(resp_server):
+    backend = RedisBackend(f'redis://127.0.0.1:{resp_server.server_address[1]}')
+    backend.set('key', b'value', 60)
+    backend._local.conn[0].shutdown(socket.SHUT_RDWR)
+    with pytest.raises(OSError):
+        backend.get('key')
+    assert backend.get('key') == b'value'
+
+
+def test_redis_backend_reports_errors(resp_server):
+    backend = RedisBackend(f'redis://:wrong@127.0.0.1:{resp_server.server_address[1]}')
+    with pytest.raises(ConnectionError, match='WRONGPASS'):
+        backend.get('key')
+
+
+@pytest.mark.parametrize('shared', [False, True])
+def test_write_in_one_worker_is_seen_by_another(app, resp_server, shared):
+    # Two EntityCache instances stand in for two worker processes; with the
+    # memory backend each has its own store and never hears of the other's writes
+    if shared:
+        app.config['ENTITY_CACHE_URL'] = f'redis://127.0.0.1:{resp_server.server_address[1]}'
+    worker_a, worker_b = EntityCache(), EntityCache()
+    patient_id = add_patient()
+    assert worker_a.get_or_load(f'patient:{patient_id}', load_first_name(patient_id)) == {'first_name': 'Ada'}
+    assert worker_a.get_or_load(f'patient:{patient_id}', load_first_name(patient_id)) == {'first_name': 'Ada'}
+    assert worker_a.hits == 1
+
+    db.session.get(Patient, patient_id).first_name = 'Grace'
+    db.session.commit()
+    assert worker_b.get_or_load(f'patient:{patient_id}', load_first_name(patient_id)) == {'first_name': 'Grace'}
+    assert worker_a.get_or_load(f'patient:{patient_id}', load_first_name(patient_id)) == {'first_name': 'Grace'}
+
+
+def test_uncommitted_writes_are_not_cached(app):
+    cache = EntityCache()
+    patient_id = add_patient()
+    db.session.get(Patient, patient_id).first_name = 'Grace'
+    db.session.flush()
+    assert cache.get_or_load(f'patient:{patient_id}', load_first_name(patient_id)) == {'first_name': 'Grace'}
+    db.session.rollback()
+    assert cache.get_or_load(f'patient:{patient_id}', load_first_name(patient_id)) == {'first_name': 'Ada'}
+
+
+def test_cache_hit_reuses_versions_from_etag_check(app, client, make_user):
+    _, headers = make_user('doc')
+    patient_id = add_patient()
+    db.session.add(PatientRecord(patient_id=patient_id, doctor='doc', notes='Follow up'))
+    db.session.commit()
+    client.get(f'/api/patients/{patient_id}/records', headers=headers)
+
+    # Requests share the test's app context: start from a fresh connection so
+    # the listener sees every statement, and forget the first request's versions
+    db.session.remove()
+    g.pop('data_versions', None)
+    statements = []
+    listener = lambda *args: statements.append(args[2])  # noqa: E731
+    event.listen(db.engine, 'before_cursor_execute', listener)
+    try:
+        response = client.get(f'/api/patients/{patient_id}/records', headers=headers)
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', listener)
+    assert [record['notes_excerpt'] for record in response.get_json()] == ['Follow up']
+    assert len(statements) == 1, statements
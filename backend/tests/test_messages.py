@@ -0,0 +1,38 @@
+import time
+from sqlalchemy import event
+from models import db
+
+
+def test_long_poll_ignores_messages_from_other_partners(app, client, make_user):
+    a_id, a = make_user('a')
+    b_id, b = make_user('b')
+    c_id, c = make_user('c')
+    assert client.post('/api/messages', json={'recipient_id': a_id, 'content': 'from b'}, headers=b).status_code == 201
+    assert client.post('/api/messages', json={'recipient_id': a_id, 'content': 'from c'}, headers=c).status_code == 201
+
+    # Requests share the test's session; start from a fresh connection so the listener sees every statement
+    db.session.remove()
+    statements = []
+    listener = lambda *args: statements.append(args[2])  # noqa: E731
+    event.listen(db.engine, 'before_cursor_execute', listener)
+    try:
+        started = time.monotonic()
+        response = client.get(f'/api/messages?user_id={b_id}&since_id=1&wait=1', headers=a)
+        elapsed = time.monotonic() - started
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', listener)
+
+    assert response.status_code == 200
+    assert response.get_json() == []
+    assert elapsed >= 0.9
+    # One fetch before waiting, one after the wake-up for c's message, one on timeout
+    assert 0 < len(statements) < 10, statements
+
+
+def test_long_poll_returns_new_message_from_partner(app, client, make_user):
+    a_id, a = make_user('a')
+    b_id, b = make_user('b')
+    client.post('/api/messages', json={'recipient_id': a_id, 'content': 'first'}, headers=b)
+    client.post('/api/messages', json={'recipient_id': a_id, 'content': 'second'}, headers=b)
+    response = client.get(f'/api/messages?user_id={b_id}&since_id=1&wait=1', headers=a)
+    assert [m['content'] for m in response.get_json()] == ['second']
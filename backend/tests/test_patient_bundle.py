@@ -0,0 +1,32 @@
+from datetime import datetime
+from models import db, Patient, PatientRecord
+
+
+def test_records_page_through_undated_records(client, make_user):
+    _, headers = make_user('doc')
+    patient = Patient(first_name='Ada', last_name='Lovelace', email='ada@example.com')
+    db.session.add(patient)
+    db.session.flush()
+    for notes, record_date in (('old', datetime(2025, 1, 1)), ('undated', None), ('new', datetime(2026, 1, 1))):
+        record = PatientRecord(patient_id=patient.id, doctor='doc', notes=notes)
+        db.session.add(record)
+        db.session.flush()
+        record.record_date = record_date  # overrides the column default
+    db.session.commit()
+
+    patient_id = patient.id
+    seen, cursor = [], None
+    for _ in range(4):
+        # Requests share the test's session; start each one without the previous page loaded
+        db.session.remove()
+        params = {'include': 'records', 'records_limit': 1}
+        if cursor:
+            params['records_cursor'] = cursor
+        response = client.get(f'/api/patients/{patient_id}', query_string=params, headers=headers)
+        assert response.status_code == 200, response.get_json()
+        payload = response.get_json()
+        seen += [record['notes_excerpt'] for record in payload['records']]
+        cursor = payload['records_next_cursor']
+        if not cursor:
+            break
+    assert seen == ['new', 'old', 'undated']
@@ -0,0 +1,56 @@
+import pytest
+from models import db, Patient
+
+
+@pytest.fixture
+def patient_id(app):
+    patient = Patient(first_name='Ada', last_name='Lovelace', email='ada@example.com')
+    db.session.add(patient)
+    db.session.commit()
+    return patient.id
+
+
+@pytest.mark.parametrize('payload, error', [
+    ({'age': 'abc'}, 'Age must be a whole number'),
+    ({'age': True}, 'Age must be a whole number'),
+    ({'age': 200}, 'Age must be between 0 and 150'),
+    ({'home_phone': '1' * 21}, 'home_phone must be at most 20 characters'),
+    ({'occupation': 7}, 'occupation must be a string'),
+    ({'first_name': ' '}, 'First name must be a non-empty string'),
+])
+def test_update_patient_applies_create_rules(client, make_user, patient_id, payload, error):
+    _, headers = make_user('doc')
+    response = client.put(f'/api/patients/{patient_id}', json=payload, headers=headers)
+    assert response.status_code == 400
+    assert response.get_json() == {'error': error}
+
+
+def test_update_patient_converts_values(client, make_user, patient_id):
+    _, headers = make_user('doc')
+    response = client.put(f'/api/patients/{patient_id}', json={'age': '42', 'home_phone': None}, headers=headers)
+    assert response.status_code == 200
+    patient = db.session.get(Patient, patient_id)
+    db.session.refresh(patient)
+    assert patient.age == 42
+
+
+def test_csv_import_reports_invalid_age_like_json(client, make_user):
+    _, headers = make_user('doc')
+    body = 'first_name,last_name,email,age\nAda,Lovelace,ada@example.com,abc\nAlan,Turing,alan@example.com,41\n'
+    response = client.post('/api/patients/import?format=csv', data=body,
+                           headers={**headers, 'Content-Type': 'text/csv'})
+    report = response.get_json()
+    assert report['imported'] == 1
+    assert report['errors'] == [{'row': 1, 'error': 'Age must be a whole number'}]
+
+
+@pytest.mark.parametrize('name, expected', [('lov', ['Ada']), ('ADA', ['Ada']), ('tur', ['Alan']), ('x', [])])
+def test_patient_list_name_filter_matches_either_name_by_prefix(client, make_user, name, expected):
+    _, headers = make_user('doc')
+    db.session.add_all([
+        Patient(first_name='Ada', last_name='Lovelace', email='ada@example.com'),
+        Patient(first_name='Alan', last_name='Turing', email='alan@example.com'),
+    ])
+    db.session.commit()
+    response = client.get('/api/patients', query_string={'name': name}, headers=headers)
+    assert [p['first_name'] for p in response.get_json()['patients']] == expected
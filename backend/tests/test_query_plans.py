@@ -0,0 +1,60 @@
+import random
+from datetime import date, datetime, time, timedelta
+import pytest
+from models import db, Patient, Appointment, PatientRecord, Message
+from query_plans import check_plans, explain, hot_queries
+
+PATIENTS = 2000
+DOCTORS = 20
+
+
+@pytest.fixture
+def seeded(app):
+    """A few thousand rows per table, enough for the planner to prefer indexes."""
+    rng = random.Random(1)
+    today = date.today()
+    db.session.execute(Patient.__table__.insert(), [
+        {'first_name': f'First{n}', 'last_name': f'Last{rng.randint(0, 500):03d}', 'email': f'p{n}@example.com'}
+        for n in range(PATIENTS)
+    ])
+    db.session.execute(Appointment.__table__.insert(), [
+        {'patient_id': rng.randint(1, PATIENTS), 'doctor': f'doctor{n % DOCTORS}',
+         'appointment_date': today + timedelta(days=rng.randint(-365, 365)),
+         'appointment_time': time(rng.randint(9, 16), rng.choice((0, 30)))}
+        for n in range(10000)
+    ])
+    db.session.execute(PatientRecord.__table__.insert(), [
+        {'patient_id': rng.randint(1, PATIENTS), 'doctor': 'doctor0', 'notes': 'Follow up', 'notes_excerpt': 'Follow up',
+         'record_date': datetime(2025, 1, 1) + timedelta(hours=n)}
+        for n in range(5000)
+    ])
+    db.session.execute(Message.__table__.insert(), [
+        {'sender_id': rng.randint(1, 40), 'recipient_id': rng.randint(1, 40), 'content': 'hello',
+         'created_at': datetime(2025, 1, 1) + timedelta(minutes=n), 'read': False}
+        for n in range(10000)
+    ])
+    db.session.commit()
+    with db.engine.connect() as conn:
+        conn.exec_driver_sql('ANALYZE')
+    return app
+
+
+def test_hot_queries_use_indexes(seeded):
+    results = check_plans()
+    regressed = {name: plan for name, (plan, seq_scan) in results.items() if seq_scan}
+    assert not regressed, f'Sequential scans in: {regressed}'
+
+
+@pytest.mark.parametrize('name, index', [
+    ('get_patients (next page)', 'ix_patient_last_name_id'),
+    ('get_patients (name filter)', 'ix_patient_first_name_lower'),
+    ('get_patients (name filter)', 'ix_patient_last_name_lower'),
+    ('get_appointments (week view)', 'ix_appointment_date_time'),
+    ('get_appointments (doctor day)', 'ix_appointment_doctor_date'),
+    ('get_appointments (patient)', 'ix_appointment_patient_date'),
+    ('get_patient_records', 'ix_patient_record_patient_date'),
+    ('get_messages', 'ix_message_conversation'),
+])
+def test_hot_query_uses_expected_index(seeded, name, index):
+    plan = explain(hot_queries()[name])
+    assert any(index in line for line in plan), plan
@@ -0,0 +1,63 @@
+import threading
+import time
+from collections import OrderedDict, namedtuple
+from sqlalchemy import event
+from models import User
+
+# Detached, immutable snapshot of the fields authenticated endpoints need
+CachedUser = namedtuple('CachedUser', ['id', 'username', 'role'])
+
+
+class UserCache:
+    """Per-process TTL cache of username -> CachedUser.
+
+    Entries are dropped whenever a User row is inserted, updated or deleted
+    through the ORM, and expire after `ttl` seconds regardless, so changes made
+    by other processes are picked up within that window.
+    """
+
+    def __init__(self, ttl=60, maxsize=1024):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries = OrderedDict()  # username -> (expires_at, CachedUser)
+        self._lock = threading.Lock()
+
+    def get(self, username):
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(username)
+            if entry and entry[0] > now:
+                self._entries.move_to_end(username)
+                return entry[1]
+        user = User.query.filter_by(username=username).first()
+        if not user:
+            return None
+        cached = CachedUser(user.id, user.username, user.role)
+        with self._lock:
+            self._entries[username] = (now + self.ttl, cached)
+            self._entries.move_to_end(username)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return cached
+
+    def invalidate(self, username=None):
+        with self._lock:
+            if username is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(username, None)
+
+
+user_cache = UserCache()
+
+
+@event.listens_for(User, 'after_insert')
+@event.listens_for(User, 'after_delete')
+def _invalidate_user(mapper, connection, target):
+    user_cache.invalidate(target.username)
+
+
+@event.listens_for(User, 'after_update')
+def _invalidate_updated_user(mapper, connection, target):
+    # The username itself may have changed, so drop everything
+    user_cache.invalidate()
@@ -0,0 +1,103 @@
+import re
+from datetime import datetime
+from models import Patient
+
+# Optional Patient string fields copied through as given
+PATIENT_OPTIONAL_FIELDS = ('home_address', 'home_phone', 'personal_phone', 'occupation', 'medical_insurance')
+# Oldest age accepted
+MAX_PATIENT_AGE = 150
+
+
+def _max_length(field):
+    return Patient.__table__.c[field].type.length
+
+
+def _check_length(field, value):
+    # The database would reject an over-long value for the whole batch (PostgreSQL)
+    limit = _max_length(field)
+    if limit is not None and len(value) > limit:
+        return f'{field} must be at most {limit} characters'
+    return None
+
+
+# Helper function to validate email format
+def is_valid_email(email):
+    pattern = r'^\S+@\S+\.\S+$'
+    return re.match(pattern, email) is not None
+
+
+def validate_patient_fields(data):
+    """Validates the Patient fields present in data (shared by create, update and import).
+
+    Returns (values, None) with the column values for those fields only, or
+    (None, error).
+    """
+    values = {}
+    for field, label in (('first_name', 'First name'), ('last_name', 'Last name')):
+        if field in data:
+            if not isinstance(data[field], str) or not data[field].strip():
+                return None, f'{label} must be a non-empty string'
+            values[field] = data[field].strip()
+    if 'email' in data:
+        if not isinstance(data['email'], str) or not is_valid_email(data['email']):
+            return None, 'Invalid email format'
+        values['email'] = data['email'].strip()
+    for field in ('first_name', 'last_name', 'email'):
+        if field in values:
+            error = _check_length(field, values[field])
+            if error:
+                return None, error
+
+    if 'age' in data:
+        # Age arrives as a number from JSON and as a string from CSV
+        age = data['age']
+        if age is None or age == '':
+            age = None
+        elif isinstance(age, str) and age.strip().isdigit():
+            age = int(age.strip())
+        elif not isinstance(age, int) or isinstance(age, bool):
+            return None, 'Age must be a whole number'
+        if age is not None and not 0 <= age <= MAX_PATIENT_AGE:
+            return None, f'Age must be between 0 and {MAX_PATIENT_AGE}'
+        values['age'] = age
+
+    if 'birth_date' in data:
+        # Convert birth_date string to date object if provided
+        birth_date = data['birth_date']
+        if birth_date:
+            try:
+                birth_date = datetime.strptime(birth_date, '%Y-%m-%d').date()
+            except (TypeError, ValueError):
+                return None, 'Invalid birth_date format. Expected YYYY-MM-DD.'
+        else:
+            birth_date = None
+        values['birth_date'] = birth_date
+
+    for field in PATIENT_OPTIONAL_FIELDS:
+        if field not in data:
+            continue
+        value = data[field]
+        if value is not None:
+            if not isinstance(value, str):
+                return None, f'{field} must be a string'
+            error = _check_length(field, value)
+            if error:
+                return None, error
+        values[field] = value
+    return values, None
+
+
+def validate_new_patient(data):
+    """Validates a new patient payload (add_patient and bulk import rules).
+
+    Returns (values, None) with the Patient column values, or (None, error).
+    """
+    # Validate required fields: first_name, last_name, and email are required.
+    if 'first_name' not in data or 'last_name' not in data or 'email' not in data:
+        return None, 'Missing required fields: first_name, last_name, email'
+    values, error = validate_patient_fields(data)
+    if error:
+        return None, error
+    for field in ('age', 'birth_date') + PATIENT_OPTIONAL_FIELDS:
+        values.setdefault(field, None)
+    return values, None
@@ -0,0 +1,128 @@
+import hashlib
+from datetime import datetime
+from functools import wraps
+from flask import g, has_app_context, request, make_response
+from sqlalchemy import event
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+from models import db, DataVersion, Patient, Appointment, PatientRecord, Message
+
+_UPSERT_DIALECTS = {'postgresql': postgresql.insert, 'sqlite': sqlite.insert}
+
+
+def conversation_key(user_a, user_b):
+    low, high = sorted((int(user_a), int(user_b)))
+    return f'message:conversation:{low}:{high}'
+
+
+def version_keys(obj):
+    """Version keys touched when obj is created, updated or deleted."""
+    if isinstance(obj, Patient):
+        return ('patient', f'patient:{obj.id}')
+    if isinstance(obj, Appointment):
+        return ('appointment', f'appointment:{obj.id}')
+    if isinstance(obj, PatientRecord):
+        return (f'patient_record:patient:{obj.patient_id}',)
+    if isinstance(obj, Message):
+        return (conversation_key(obj.sender_id, obj.recipient_id),)
+    return ()
+
+
+def bump_versions(connection, keys):
+    """Increments the given version keys inside the caller's transaction."""
+    keys = sorted(set(keys))  # stable order avoids deadlocks between concurrent writers
+    if not keys:
+        return
+    if has_app_context():
+        g.pop('data_versions', None)
+    table = DataVersion.__table__
+    now = datetime.utcnow()
+    insert = _UPSERT_DIALECTS.get(connection.dialect.name)
+    for key in keys:
+        if insert is not None:
+            connection.execute(
+                insert(table).values(key=key, version=1, updated_at=now).on_conflict_do_update(
+                    index_elements=['key'], set_={'version': table.c.version + 1, 'updated_at': now}
+                )
+            )
+            continue
+        updated = connection.execute(
+            table.update().where(table.c.key == key).values(version=table.c.version + 1, updated_at=now)
+        ).rowcount
+        if not updated:
+            connection.execute(table.insert().values(key=key, version=1, updated_at=now))
+
+
+@event.listens_for(Session, 'after_flush')
+def _bump_flushed_versions(session, flush_context):
+    # ORM writes bump their keys automatically; bulk Core statements call bump_versions themselves
+    keys = set()
+    for obj in list(session.new) + list(session.dirty) + list(session.deleted):
+        if obj in session.dirty and not session.is_modified(obj):
+            continue
+        keys.update(version_keys(obj))
+    if keys:
+        bump_versions(session.connection(), keys)
+
+
+def current_versions(keys):
+    """Returns {key: (version, updated_at)}, with (0, None) for keys never written.
+
+    Results are kept for the rest of the request, so the entity cache reuses
+    what the ETag check loaded; any version bump in the request drops them.
+    """
+    known = g.setdefault('data_versions', {})
+    missing = [key for key in keys if key not in known]
+    if missing:
+        rows = db.session.query(DataVersion.key, DataVersion.version, DataVersion.updated_at).filter(
+            DataVersion.key.in_(missing)
+        ).all()
+        known.update({key: (0, None) for key in missing})
+        known.update({key: (version, updated_at) for key, version, updated_at in rows})
+    return {key: known[key] for key in keys}
+
+
+def validators(keys):
+    """Returns (etag, last_modified) for the current versions of keys and this request's URL."""
+    state = current_versions(keys)
+    digest = hashlib.sha1(request.full_path.encode())
+    for key in sorted(keys):
+        digest.update(f'|{key}={state[key][0]}'.encode())
+    last_modified = max((updated_at for _, updated_at in state.values() if updated_at), default=None)
+    return digest.hexdigest(), last_modified
+
+
+def conditional(keys_for):
+    """Answers If-None-Match / If-Modified-Since with 304 before the view runs.
+
+    keys_for receives the view's keyword arguments and returns the version
+    keys the response depends on (or None to skip the check for this request).
+    Successful responses are tagged with the matching ETag and Last-Modified.
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            keys = keys_for(**kwargs)
+            if not keys:
+                return view(*args, **kwargs)
+            etag, last_modified = validators(keys)
+
+            if request.if_none_match:
+                fresh = request.if_none_match.contains(etag)
+            elif request.if_modified_since and last_modified:
+                fresh = last_modified.replace(microsecond=0) <= request.if_modified_since.replace(tzinfo=None)
+            else:
+                fresh = False
+            if fresh:
+                response = make_response('', 304)
+            else:
+                response = make_response(view(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+            response.set_etag(etag)
+            if last_modified:
+                response.last_modified = last_modified
+            response.headers['Cache-Control'] = 'private, no-cache'
+            return response
+        return wrapper
+    return decorator
@@ -4,7 +4,7 @@ import { Paper, Typography, Box, TextField, Button, Autocomplete } from '@mui/ma
 import { LocalizationProvider, DatePicker, TimePicker } from '@mui/x-date-pickers';
 import { AdapterDateFns } from '@mui/x-date-pickers/AdapterDateFns';
 import { useNotification } from '../context/NotificationContext';
-import { getPatients } from '../services/patientService';
+import { getPatients, searchPatients } from '../services/patientService';
 
 const AppointmentForm = ({ onSubmit, defaultPatient = null }) => {
   const [selectedPatient, setSelectedPatient] = useState(defaultPatient);
@@ -13,6 +13,7 @@ const AppointmentForm = ({ onSubmit, defaultPatient = null }) => {
   const [appointmentTime, setAppointmentTime] = useState(null);
   const [doctor, setDoctor] = useState('');
   const [error, setError] = useState('');
+  const [patientQuery, setPatientQuery] = useState('');
   const { showNotification } = useNotification();
 
   // Fetch patients only if no defaultPatient is provided (for standalone usage)
@@ -20,15 +21,18 @@ const AppointmentForm = ({ onSubmit, defaultPatient = null }) => {
     if (!defaultPatient) {
       const fetchPatients = async () => {
         try {
-          const response = await getPatients();
-          setPatients(response.data);
+          const fields = 'id,first_name,last_name';
+          const response = patientQuery
+            ? await searchPatients(patientQuery, { fields })
+            : await getPatients({ fields });
+          setPatients(response.data.patients);
         } catch (err) {
           console.error('Failed to fetch patients:', err);
         }
       };
       fetchPatients();
     }
-  }, [defaultPatient]);
+  }, [defaultPatient, patientQuery]);
 
   const handleSubmit = (e) => {
     e.preventDefault();
@@ -78,6 +82,10 @@ const AppointmentForm = ({ onSubmit, defaultPatient = null }) => {
               options={patients}
               getOptionLabel={(option) => `${option.first_name} ${option.last_name} (ID: ${option.id})`}
               onChange={(event, value) => setSelectedPatient(value)}
+              onInputChange={(event, value, reason) => {
+                if (reason === 'input') setPatientQuery(value);
+              }}
+              filterOptions={(options) => options}
               value={selectedPatient}
               renderInput={(params) => (
                 <TextField {...params} label="Patient" fullWidth margin="normal" required />
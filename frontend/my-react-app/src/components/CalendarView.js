@@ -1,9 +1,9 @@
 // src/components/CalendarView.js
 import React, { useEffect, useState } from 'react';
 import { Calendar, dateFnsLocalizer } from 'react-big-calendar';
-import { format, parse, startOfWeek, getDay } from 'date-fns';
+import { format, parse, startOfWeek, getDay, startOfMonth, endOfMonth, endOfWeek } from 'date-fns';
 import 'react-big-calendar/lib/css/react-big-calendar.css';
-import { getAppointments } from '../services/appointmentService';
+import { getCalendar } from '../services/appointmentService';
 import { Button } from '@mui/material';
 import { Link, useNavigate } from 'react-router-dom';
 import { useTheme } from '@mui/material/styles';
@@ -64,22 +64,29 @@ const CalendarView = () => {
   const isDarkMode = theme.palette.mode === 'dark';
   const navigate = useNavigate();
 
+  // Visible range of the calendar; starts as the month grid around today
+  const [range, setRange] = useState(() => {
+    const today = new Date();
+    return { start: startOfWeek(startOfMonth(today)), end: endOfWeek(endOfMonth(today)) };
+  });
+
+  // Fetch only the events in the visible range
   useEffect(() => {
     const fetchAppointments = async () => {
       try {
-        const response = await getAppointments();
-        // Transform the appointments data to calendar events using patient_name for the title
-        const events = response.data.map((appointment) => ({
-          id: appointment.id,
-          title: appointment.patient_name,
-          start: new Date(`${appointment.appointment_date}T${appointment.appointment_time}`),
-          end: new Date(
-            new Date(`${appointment.appointment_date}T${appointment.appointment_time}`).getTime() +
-              30 * 60000
-          ), // assume 30 minute duration
+        const response = await getCalendar(
+          format(range.start, 'yyyy-MM-dd'),
+          format(range.end, 'yyyy-MM-dd')
+        );
+        const events = response.data.events.map((event) => ({
+          id: event.id,
+          title: event.title,
+          start: new Date(event.start),
+          end: new Date(event.end),
           allDay: false,
         }));
         setAppointments(events);
+        setError('');
         setLoading(false);
       } catch (err) {
         setError('Failed to fetch appointments.');
@@ -88,7 +95,16 @@ const CalendarView = () => {
     };
 
     fetchAppointments();
-  }, []);
+  }, [range]);
+
+  // react-big-calendar passes an array of days (week/day views) or { start, end } (month/agenda)
+  const handleRangeChange = (newRange) => {
+    if (Array.isArray(newRange)) {
+      setRange({ start: newRange[0], end: newRange[newRange.length - 1] });
+    } else {
+      setRange({ start: newRange.start, end: newRange.end });
+    }
+  };
 
   if (loading) return <div>Loading appointments...</div>;
   if (error) return <div style={{ color: 'red' }}>{error}</div>;
@@ -106,6 +122,7 @@ const CalendarView = () => {
           startAccessor="start"
           endAccessor="end"
           onSelectEvent={(event) => navigate(`/appointments/${event.id}`)}
+          onRangeChange={handleRangeChange}
           style={{ height: '100%' }}
         />
       </div>
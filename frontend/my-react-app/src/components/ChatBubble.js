@@ -18,7 +18,7 @@ import {
 import ChatIcon from '@mui/icons-material/Chat';
 import SendIcon from '@mui/icons-material/Send';
 import CloseIcon from '@mui/icons-material/Close';
-import { getMessages, sendMessage, getConversationPartners, markMessageAsRead } from '../services/messagingService';
+import { getMessages, sendMessage, getConversationPartners, markConversationRead, openMessageStream } from '../services/messagingService';
 import { getUserId } from '../services/tokenService';
 
 const ChatBubble = () => {
@@ -26,6 +26,8 @@ const ChatBubble = () => {
   const [conversationPartners, setConversationPartners] = useState([]);
   const [partnerId, setPartnerId] = useState(null);
   const [messages, setMessages] = useState([]);
+  // Newest message id in the loaded history; the stream resumes after it (null until loaded)
+  const [streamSinceId, setStreamSinceId] = useState(null);
   const [newMessage, setNewMessage] = useState('');
   const [loading, setLoading] = useState(false);
   const [error, setError] = useState('');
@@ -55,37 +57,61 @@ const ChatBubble = () => {
     }
   }, [open, partnerId]);
 
-  // Function to fetch messages
+  // Function to fetch messages; returns the loaded list (or null on error)
   const fetchMessages = async () => {
-    if (!partnerId) return;
+    if (!partnerId) return null;
     setLoading(true);
     try {
       const response = await getMessages(partnerId);
       setMessages(response);
       setError('');
+      return response;
     } catch (err) {
       setError('Failed to load messages.');
+      return null;
+    } finally {
+      setLoading(false);
     }
-    setLoading(false);
   };
 
-  // Fetch messages when chat is open or partner changes
+  // Fetch messages when chat is open or partner changes, then let the stream take over
   useEffect(() => {
-    if (open && partnerId) {
-      fetchMessages();
-    }
+    if (!open || !partnerId) return;
+    setStreamSinceId(null);
+    fetchMessages().then((loaded) => {
+      const lastId = loaded && loaded.length > 0 ? Math.max(...loaded.map((m) => m.id)) : 0;
+      setStreamSinceId(lastId);
+    });
   }, [open, partnerId]);
 
-  // Auto-refresh to poll for new messages every 10 seconds
+  const mergeMessages = (incoming) => {
+    setMessages((prev) => {
+      const known = new Set(prev.map((m) => m.id));
+      const added = incoming.filter((m) => !known.has(m.id));
+      return added.length ? [...prev, ...added].sort((a, b) => a.id - b.id) : prev;
+    });
+  };
+
+  // Append new messages pushed by the server instead of polling the full history.
+  // The stream resumes after the last loaded message, so nothing sent between
+  // loading the history and connecting is lost.
   useEffect(() => {
-    let interval;
-    if (open && partnerId) {
-      interval = setInterval(fetchMessages, 10000);
+    if (!open || !partnerId || streamSinceId === null) return undefined;
+    const stream = openMessageStream(streamSinceId || undefined);
+    if (!streamSinceId) {
+      // Without a message to resume from the stream starts at the server's newest
+      // one, so load the (empty or new) conversation again once it is connected
+      stream.onopen = () => {
+        getMessages(partnerId).then(mergeMessages).catch(() => {});
+      };
     }
-    return () => {
-      if (interval) clearInterval(interval);
+    stream.onmessage = (event) => {
+      const msg = JSON.parse(event.data);
+      if (msg.sender_id !== partnerId && msg.recipient_id !== partnerId) return;
+      mergeMessages([msg]);
     };
-  }, [open, partnerId]);
+    return () => stream.close();
+  }, [open, partnerId, streamSinceId]);
 
   // Auto-scroll to bottom when messages update
   useEffect(() => {
@@ -94,15 +120,19 @@ const ChatBubble = () => {
     }
   }, [messages]);
 
-  // Auto-mark partner messages as read when loaded
+  // Auto-mark partner messages as read when loaded, then flag them locally so
+  // later merges do not send the same request again
   useEffect(() => {
-    messages.forEach((msg) => {
-      if (msg.sender_id === partnerId && !msg.read) {
-        markMessageAsRead(msg.id).catch((err) =>
-          console.error('Error marking message as read:', err)
-        );
-      }
-    });
+    const unread = messages.filter((msg) => msg.sender_id === partnerId && !msg.read);
+    if (unread.length === 0) return;
+    const upToId = Math.max(...unread.map((msg) => msg.id));
+    markConversationRead(partnerId, upToId)
+      .then(() => {
+        setMessages((prev) => prev.map((msg) => (
+          msg.sender_id === partnerId && msg.id <= upToId && !msg.read ? { ...msg, read: true } : msg
+        )));
+      })
+      .catch((err) => console.error('Error marking messages as read:', err));
   }, [messages, partnerId]);
 
   const handleSendMessage = async () => {
@@ -110,7 +140,10 @@ const ChatBubble = () => {
     try {
       await sendMessage(partnerId, newMessage);
       setNewMessage('');
-      fetchMessages();
+      // Show the sent message right away; the stream may deliver it too and
+      // mergeMessages drops the duplicate
+      const lastId = messages.length > 0 ? Math.max(...messages.map((m) => m.id)) : 0;
+      getMessages(partnerId, lastId ? { since_id: lastId } : {}).then(mergeMessages).catch(() => {});
       // Re-focus the input after sending a message
       messageInputRef.current?.focus();
     } catch (err) {
@@ -1,18 +1,22 @@
 // src/components/PatientRecords.js
 import React, { useEffect, useState } from 'react';
 import { Typography, Box, Paper, Button, TextField, Pagination } from '@mui/material';
-import { getPatientRecords, deletePatientRecord } from '../services/patientService';
+import { getPatientBundle, getPatientRecord, deletePatientRecord } from '../services/patientService';
 import { useSimpleLanguage } from '../context/SimpleLanguageContext';
 import PatientRecordForm from './PatientRecordForm';
 import PatientRecordView from './PatientRecordView';
 import { getUserRole } from '../services/tokenService';
 import { useNotification } from '../context/NotificationContext';
 
-const PatientRecords = ({ patientId }) => {
+// Records are loaded a page at a time, newest first. `initialRecords` and
+// `initialCursor` (from the patient bundle) skip the first fetch.
+const PatientRecords = ({ patientId, initialRecords, initialCursor }) => {
   const { t } = useSimpleLanguage();
   const { showNotification } = useNotification();
-  const [records, setRecords] = useState([]);
-  const [loading, setLoading] = useState(true);
+  const [records, setRecords] = useState(initialRecords || []);
+  const [nextCursor, setNextCursor] = useState(initialCursor || null);
+  const [loading, setLoading] = useState(!initialRecords);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [error, setError] = useState('');
   const [formOpen, setFormOpen] = useState(false);
   const [editingRecord, setEditingRecord] = useState(null);
@@ -28,8 +32,9 @@ const PatientRecords = ({ patientId }) => {
   const fetchRecords = async () => {
     setLoading(true);
     try {
-      const response = await getPatientRecords(patientId);
-      setRecords(response.data);
+      const response = await getPatientBundle(patientId, ['records']);
+      setRecords(response.data.records);
+      setNextCursor(response.data.records_next_cursor);
       setError('');
     } catch (err) {
       setError(t('failedToFetchRecords') || 'Failed to fetch records.');
@@ -38,7 +43,23 @@ const PatientRecords = ({ patientId }) => {
     }
   };
 
+  const loadMoreRecords = async () => {
+    setLoadingMore(true);
+    try {
+      const response = await getPatientBundle(patientId, ['records'], { records_cursor: nextCursor });
+      setRecords((current) => [...current, ...response.data.records]);
+      setNextCursor(response.data.records_next_cursor);
+    } catch (err) {
+      showNotification(t('failedToFetchRecords') || 'Failed to fetch records.', 'error');
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   useEffect(() => {
+    if (initialRecords) {
+      return;
+    }
     fetchRecords();
   }, [patientId, t]);
 
@@ -46,7 +67,7 @@ const PatientRecords = ({ patientId }) => {
   const filteredRecords = records.filter((record) => {
     const query = searchQuery.toLowerCase();
     return (
-      record.notes.toLowerCase().includes(query) ||
+      record.notes_excerpt.toLowerCase().includes(query) ||
       (record.diagnosis && record.diagnosis.toLowerCase().includes(query)) ||
       (record.doctor && record.doctor.toLowerCase().includes(query))
     );
@@ -81,13 +102,30 @@ const PatientRecords = ({ patientId }) => {
     }
   };
 
-  const handleEditRecord = (record) => {
-    setEditingRecord(record);
-    setFormOpen(true);
+  // The list only has an excerpt of the notes; load the full record on demand
+  const fetchFullRecord = async (record) => {
+    try {
+      const response = await getPatientRecord(patientId, record.id);
+      return response.data;
+    } catch (err) {
+      showNotification(t('failedToFetchRecords') || 'Failed to fetch records.', 'error');
+      return null;
+    }
   };
 
-  const handleViewRecord = (record) => {
-    setViewingRecord(record);
+  const handleEditRecord = async (record) => {
+    const fullRecord = await fetchFullRecord(record);
+    if (fullRecord) {
+      setEditingRecord(fullRecord);
+      setFormOpen(true);
+    }
+  };
+
+  const handleViewRecord = async (record) => {
+    const fullRecord = await fetchFullRecord(record);
+    if (fullRecord) {
+      setViewingRecord(fullRecord);
+    }
   };
 
   return (
@@ -119,7 +157,7 @@ const PatientRecords = ({ patientId }) => {
                 {t('doctor')}: {record.doctor}
               </Typography>
               <Typography variant="body2">
-                {t('notes')}: {record.notes}
+                {t('notes')}: {record.notes_excerpt}
               </Typography>
               {record.diagnosis && (
                 <Typography variant="body2">
@@ -171,6 +209,11 @@ const PatientRecords = ({ patientId }) => {
               sx={{ mt: 2 }}
             />
           )}
+          {nextCursor && (
+            <Button variant="text" sx={{ mt: 1 }} disabled={loadingMore} onClick={loadMoreRecords}>
+              {t('loadOlderRecords') || 'Load older records'}
+            </Button>
+          )}
         </>
       )}
       {role === 'doctor' && (
@@ -4,24 +4,25 @@ import { Typography, Paper, Box } from '@mui/material';
 import { Link } from 'react-router-dom';
 import { getAppointments } from '../services/appointmentService';
 
-const UpcomingAppointments = ({ patientId }) => {
-  const [appointments, setAppointments] = useState([]);
-  const [loading, setLoading] = useState(true);
+// `initialAppointments` (e.g. from the patient bundle) skips the fetch
+const UpcomingAppointments = ({ patientId, appointments: initialAppointments }) => {
+  const [appointments, setAppointments] = useState(initialAppointments || []);
+  const [loading, setLoading] = useState(!initialAppointments);
   const [error, setError] = useState('');
 
   useEffect(() => {
+    if (initialAppointments) {
+      setAppointments(initialAppointments);
+      setLoading(false);
+      return;
+    }
     const fetchAppointments = async () => {
       setLoading(true);
       try {
-        const response = await getAppointments();
-        // Filter appointments for the given patient and only those on or after today
+        // Only this patient's appointments on or after today
         const today = new Date().toISOString().split('T')[0];
-        const patientAppointments = response.data.filter(
-          (appt) =>
-            appt.patient_id === patientId &&
-            appt.appointment_date >= today
-        );
-        setAppointments(patientAppointments);
+        const response = await getAppointments({ patient_id: patientId, from: today });
+        setAppointments(response.data);
       } catch (err) {
         setError('Failed to fetch appointments.');
       }
@@ -29,7 +30,7 @@ const UpcomingAppointments = ({ patientId }) => {
     };
 
     fetchAppointments();
-  }, [patientId]);
+  }, [patientId, initialAppointments]);
 
   if (loading) return <Typography>Loading appointments...</Typography>;
   if (error) return <Typography color="error">{error}</Typography>;
@@ -22,6 +22,7 @@ const translations = {
     loadingRecords: "Loading records...",
     patientRecords: "Patient Records",
     noRecordsFound: "No records found.",
+    loadOlderRecords: "Load older records",
     recordDate: "Record Date",
     notes: "Notes",
     diagnosis: "Diagnosis",
@@ -70,7 +71,15 @@ const translations = {
     upcomingAppointments: "Upcoming Appointments",
     failedToLoadPatient: "Failed to load patient details.",
     loadingPatient: "Loading patient details...",
-    patientNotFound: "Patient not found."
+    patientNotFound: "Patient not found.",
+
+    // Dashboard summary
+    nextPatient: "Next patient",
+    noNextPatient: "No more patients today.",
+    unreadMessages: "Unread messages",
+    completed: "Completed",
+    inProgress: "In progress",
+    upcoming: "Upcoming"
   },
   es: {
     welcome: "Bienvenido",
@@ -92,6 +101,7 @@ const translations = {
     loadingRecords: "Cargando registros...",
     patientRecords: "Registros del Paciente",
     noRecordsFound: "No se encontraron registros.",
+    loadOlderRecords: "Cargar registros anteriores",
     recordDate: "Fecha del Registro",
     notes: "Notas",
     diagnosis: "Diagnóstico",
@@ -141,7 +151,13 @@ const translations = {
     upcomingAppointments: "Próximas Citas",
     failedToLoadPatient: "Error al cargar los detalles del paciente.",
     loadingPatient: "Cargando detalles del paciente...",
-    patientNotFound: "Paciente no encontrado."
+    patientNotFound: "Paciente no encontrado.",
+    nextPatient: "Siguiente paciente",
+    noNextPatient: "No quedan pacientes hoy.",
+    unreadMessages: "Mensajes sin leer",
+    completed: "Completadas",
+    inProgress: "En curso",
+    upcoming: "Pendientes"
   }
 };
 
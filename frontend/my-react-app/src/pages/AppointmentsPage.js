@@ -10,7 +10,6 @@ import { Link } from 'react-router-dom';
 
 const AppointmentsPage = () => {
   const [tabValue, setTabValue] = useState(0);
-  const [appointments, setAppointments] = useState([]);
   const [filteredAppointments, setFilteredAppointments] = useState([]);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState('');
@@ -28,50 +27,29 @@ const AppointmentsPage = () => {
   const [dailyQueuePage, setDailyQueuePage] = useState(1);
   const dailyQueuePageSize = 5;
 
-  // Fetch appointments on component mount
+  // Fetch the Appointment List whenever its filters change; filtering runs server-side
   useEffect(() => {
     fetchAppointments();
-  }, []);
+  }, [filterDate, filterDoctor, filterPatient]);
 
-  // Filter appointments for Appointment List tab
+  // Fetch the Daily Queue for the selected date
   useEffect(() => {
-    let filtered = [...appointments];
-
-    if (filterDate) {
-      const filterDateString = filterDate.toISOString().split('T')[0]; // YYYY-MM-DD
-      filtered = filtered.filter(a => a.appointment_date === filterDateString);
-    }
-
-    if (filterDoctor.trim()) {
-      filtered = filtered.filter(a => 
-        a.doctor.toLowerCase().includes(filterDoctor.trim().toLowerCase())
-      );
-    }
-
-    if (filterPatient.trim()) {
-      // Assuming filterPatient refers to patient name
-      filtered = filtered.filter(a => 
-        a.patient_name && a.patient_name.toLowerCase().includes(filterPatient.trim().toLowerCase())
-      );
-    }
-
-    setFilteredAppointments(filtered);
-  }, [filterDate, filterDoctor, filterPatient, appointments]);
-
-  // Filter appointments for Daily Queue tab when dailyQueueDate changes or appointments update
-  useEffect(() => {
-    if (!dailyQueueDate) return;
-    const queueDateString = dailyQueueDate.toISOString().split('T')[0];
-    const daily = appointments.filter(a => a.appointment_date === queueDateString);
-    setDailyQueueAppointments(daily);
-    setDailyQueuePage(1); // Reset to first page when date changes
-  }, [dailyQueueDate, appointments]);
+    fetchDailyQueue();
+  }, [dailyQueueDate]);
 
   const fetchAppointments = async () => {
     setLoading(true);
     try {
-      const response = await getAppointments();
-      setAppointments([...response.data]); // Force a new array instance
+      const params = {};
+      if (filterDate) {
+        const filterDateString = filterDate.toISOString().split('T')[0]; // YYYY-MM-DD
+        params.from = filterDateString;
+        params.to = filterDateString;
+      }
+      if (filterDoctor.trim()) params.doctor = filterDoctor.trim();
+      if (filterPatient.trim()) params.patient_name = filterPatient.trim();
+      const response = await getAppointments(params);
+      setFilteredAppointments([...response.data]); // Force a new array instance
       setLoading(false);
     } catch (err) {
       console.error("Error fetching appointments:", err);
@@ -80,6 +58,19 @@ const AppointmentsPage = () => {
     }
   };
 
+  const fetchDailyQueue = async () => {
+    if (!dailyQueueDate) return;
+    try {
+      const queueDateString = dailyQueueDate.toISOString().split('T')[0];
+      const response = await getAppointments({ from: queueDateString, to: queueDateString });
+      setDailyQueueAppointments(response.data);
+      setDailyQueuePage(1); // Reset to first page when date changes
+    } catch (err) {
+      console.error("Error fetching daily queue:", err);
+      setError('Failed to fetch appointments.');
+    }
+  };
+
   const handleTabChange = (event, newValue) => {
     setTabValue(newValue);
     setError('');
@@ -90,6 +81,7 @@ const AppointmentsPage = () => {
       await addAppointment(appointmentData);
       // Re-fetch appointments so that both Appointment List and Daily Queue update
       fetchAppointments();
+      fetchDailyQueue();
       setTabValue(0);
     } catch (err) {
       console.error(err);
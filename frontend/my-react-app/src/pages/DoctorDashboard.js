@@ -16,7 +16,7 @@ import {
 import { DatePicker, LocalizationProvider } from '@mui/x-date-pickers';
 import { AdapterDateFns } from '@mui/x-date-pickers/AdapterDateFns';
 import { logout } from '../services/authService';
-import { getAppointments } from '../services/appointmentService';
+import { getDoctorDashboard } from '../services/appointmentService';
 import { getUserName } from '../services/tokenService';
 import CurrentTime from '../components/CurrentTime';
 import SimpleLanguageSwitcher from '../components/SimpleLanguageSwitcher';
@@ -34,7 +34,7 @@ const DoctorDashboard = () => {
 
   // Daily Queue state
   const [dailyQueueDate, setDailyQueueDate] = useState(new Date());
-  const [dailyQueueAppointments, setDailyQueueAppointments] = useState([]);
+  const [dashboard, setDashboard] = useState(null);
   const [loadingAppointments, setLoadingAppointments] = useState(true);
   const [appointmentsError, setAppointmentsError] = useState('');
 
@@ -42,17 +42,15 @@ const DoctorDashboard = () => {
   const [dailyQueuePage, setDailyQueuePage] = useState(1);
   const dailyQueuePageSize = 3;
 
-  // Fetch appointments for the selected date
+  // One request returns the day's queue, status counts, next patient and unread totals
   useEffect(() => {
-    const fetchDailyAppointments = async () => {
+    const fetchDashboard = async () => {
       setLoadingAppointments(true);
       try {
-        const response = await getAppointments();
         const selectedDateString = dailyQueueDate.toISOString().split('T')[0];
-        const daily = response.data.filter(
-          (appointment) => appointment.appointment_date === selectedDateString
-        );
-        setDailyQueueAppointments(daily);
+        const response = await getDoctorDashboard(selectedDateString);
+        setDashboard(response.data);
+        setDailyQueuePage(1);
         setAppointmentsError('');
       } catch (error) {
         setAppointmentsError(t('failedToFetchAppointments') || 'Failed to fetch daily appointments.');
@@ -61,18 +59,20 @@ const DoctorDashboard = () => {
       }
     };
 
-    fetchDailyAppointments();
+    fetchDashboard();
   }, [dailyQueueDate, t]);
 
+  const dailyQueueAppointments = dashboard ? dashboard.queue : [];
+  const counts = dashboard ? dashboard.counts : { total: 0, completed: 0, in_progress: 0, upcoming: 0 };
+  const nextPatient = dashboard ? dashboard.next_patient : null;
+  const unreadMessages = dashboard ? dashboard.unread_messages.total : 0;
+
   // Pagination calculations for Daily Queue
   const dailyQueuePageCount = Math.ceil(dailyQueueAppointments.length / dailyQueuePageSize);
   const startIndex = (dailyQueuePage - 1) * dailyQueuePageSize;
   const endIndex = startIndex + dailyQueuePageSize;
   const dailyQueuePaginated = dailyQueueAppointments.slice(startIndex, endIndex);
 
-  // Quick Stats: count of today's appointments
-  const todayAppointmentsCount = dailyQueueAppointments.length;
-
   return (
     <Box sx={{ display: "flex" }}>
       <AppBar position="absolute">
@@ -112,7 +112,17 @@ const DoctorDashboard = () => {
                   {t('quickStats') || "Quick Stats"}
                 </Typography>
                 <Typography variant="body1">
-                  {t('todayAppointments') || "Today's Appointments"}: {todayAppointmentsCount}
+                  {t('todayAppointments') || "Today's Appointments"}: {counts.total}
+                  {' '}({t('completed')}: {counts.completed}, {t('inProgress')}: {counts.in_progress}, {t('upcoming')}: {counts.upcoming})
+                </Typography>
+                <Typography variant="body1">
+                  {t('nextPatient')}:{' '}
+                  {nextPatient
+                    ? `${nextPatient.patient_name} (${nextPatient.appointment_time.slice(0, 5)}, ${nextPatient.doctor})`
+                    : t('noNextPatient')}
+                </Typography>
+                <Typography variant="body1">
+                  {t('unreadMessages')}: {unreadMessages}
                 </Typography>
               </Paper>
             </Grid>
@@ -149,7 +159,7 @@ const DoctorDashboard = () => {
                           <strong>{t('patientId')}:</strong> {appointment.patient_name}
                         </Typography>
                         <Typography variant="body2">
-                          <strong>{t('recordDate')}: </strong> {appointment.appointment_date}
+                          <strong>{t('recordDate')}: </strong> {dashboard.date}
                         </Typography>
                         <Typography variant="body2">
                           <strong>{t('time')}: </strong> {appointment.appointment_time}
@@ -11,7 +11,7 @@ import {
   Tabs,
   Tab
 } from "@mui/material";
-import { getPatient } from "../services/patientService";
+import { getPatientBundle } from "../services/patientService";
 import { addAppointment } from "../services/appointmentService";
 import PatientRecords from "../components/PatientRecords";
 import AppointmentForm from "../components/AppointmentForm";
@@ -58,7 +58,15 @@ const PatientDetail = () => {
   useEffect(() => {
     const fetchPatient = async () => {
       try {
-        const response = await getPatient(id);
+        // One request for the chart: the patient, the first page of records
+        // and the coming year's appointments
+        const today = new Date();
+        const until = new Date(today);
+        until.setDate(until.getDate() + 365);
+        const response = await getPatientBundle(id, ["appointments", "records"], {
+          appointments_from: today.toISOString().split("T")[0],
+          appointments_to: until.toISOString().split("T")[0],
+        });
         setPatient(response.data);
       } catch (err) {
         console.error("Error fetching patient:", err);
@@ -143,10 +151,14 @@ const PatientDetail = () => {
           <Tab label={t("upcomingAppointments") || "Upcoming Appointments"} id="patient-detail-tab-1" />
         </Tabs>
         <TabPanel value={tabValue} index={0}>
-          <PatientRecords patientId={id} />
+          <PatientRecords
+            patientId={id}
+            initialRecords={patient.records}
+            initialCursor={patient.records_next_cursor}
+          />
         </TabPanel>
         <TabPanel value={tabValue} index={1}>
-          <UpcomingAppointments patientId={patient.id} />
+          <UpcomingAppointments patientId={patient.id} appointments={patient.appointments} />
         </TabPanel>
       </Box>
 
@@ -9,14 +9,17 @@ const Patients = () => {
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState('');
   const [message, setMessage] = useState('');
+  const [nextCursor, setNextCursor] = useState(null);
 
   // Function to fetch patients from the backend
-  const fetchPatients = async () => {
+  const fetchPatients = async (cursor = null) => {
     console.log("Fetching patients...");
     try {
-      const response = await getPatients();
+      const response = await getPatients(cursor ? { cursor } : {});
       console.log("Fetched patients:", response.data);
-      setPatients([...response.data]); // Force a new array instance
+      const page = response.data.patients;
+      setPatients((prev) => (cursor ? [...prev, ...page] : [...page])); // Force a new array instance
+      setNextCursor(response.data.next_cursor);
       setLoading(false);
     } catch (err) {
       console.error("Error fetching patients:", err);
@@ -53,7 +56,12 @@ const Patients = () => {
       ) : error ? (
         <p style={{ color: 'red' }}>{error}</p>
       ) : (
-        <PatientList patients={patients} setPatients={setPatients} key={patients.length} />
+        <>
+          <PatientList patients={patients} setPatients={setPatients} key={patients.length} />
+          {nextCursor && (
+            <button onClick={() => fetchPatients(nextCursor)}>Load more</button>
+          )}
+        </>
       )}
     </div>
   );
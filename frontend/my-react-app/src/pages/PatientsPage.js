@@ -8,7 +8,7 @@ import { getPatients, addPatient } from '../services/patientService';
 const PatientsPage = () => {
   const [tabValue, setTabValue] = useState(0);
   const [patients, setPatients] = useState([]);
-  const [filteredPatients, setFilteredPatients] = useState([]);
+  const [nextCursor, setNextCursor] = useState(null);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState('');
 
@@ -28,34 +28,22 @@ const PatientsPage = () => {
 
   const [searchQuery, setSearchQuery] = useState('');
 
-  // Fetch patients on component mount
+  // Fetch the first page on mount and whenever the search query changes;
+  // name filtering happens server-side.
   useEffect(() => {
     fetchPatients();
-  }, []);
+  }, [searchQuery]);
 
-  // Filter patients based on search query (first + last name, and email)
-  useEffect(() => {
-    if (!searchQuery) {
-      setFilteredPatients(patients);
-    } else {
-      const query = searchQuery.toLowerCase();
-      const filtered = patients.filter((patient) => {
-        // Combine first and last name for search
-        const fullName = `${patient.first_name} ${patient.last_name}`.toLowerCase();
-        return (
-          fullName.includes(query) ||
-          patient.email.toLowerCase().includes(query)
-        );
-      });
-      setFilteredPatients(filtered);
-    }
-  }, [searchQuery, patients]);
-
-  const fetchPatients = async () => {
-    setLoading(true);
+  const fetchPatients = async (cursor = null) => {
+    setLoading(!cursor);
     try {
-      const response = await getPatients();
-      setPatients([...response.data]); // Force a new array instance
+      const params = {};
+      if (searchQuery) params.name = searchQuery;
+      if (cursor) params.cursor = cursor;
+      const response = await getPatients(params);
+      const page = response.data.patients;
+      setPatients((prev) => (cursor ? [...prev, ...page] : [...page])); // Force a new array instance
+      setNextCursor(response.data.next_cursor);
       setLoading(false);
     } catch (err) {
       console.error("Error fetching patients:", err);
@@ -144,7 +132,14 @@ const PatientsPage = () => {
             ) : error ? (
               <Typography color="error">{error}</Typography>
             ) : (
-              <PatientList patients={filteredPatients} setPatients={setPatients} />
+              <>
+                <PatientList patients={patients} setPatients={setPatients} />
+                {nextCursor && (
+                  <Button variant="text" onClick={() => fetchPatients(nextCursor)}>
+                    Load more
+                  </Button>
+                )}
+              </>
             )}
           </>
         )}
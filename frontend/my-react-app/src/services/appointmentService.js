@@ -1,16 +1,39 @@
 // src/services/appointmentService.js
 import API from './api';
 
-export const getAppointments = () => {
-  return API.get('/appointments');
+// Optional filters: from, to (YYYY-MM-DD), doctor, patient_id, patient_name
+export const getAppointments = (params = {}) => {
+  return API.get('/appointments', { params });
 };
 
 export const addAppointment = (appointmentData) => {
   return API.post('/appointments', appointmentData);
 };
 
+// Books a series atomically. Send { patient_id, doctor, appointments: [{ appointment_date, appointment_time }] }
+// or { patient_id, doctor, recurrence: { start_date, appointment_time, frequency: 'weekly' | 'daily',
+// interval, until | count } }. A 409 carries `conflicts` listing every clashing occurrence.
+export const addAppointmentsBulk = (seriesData) => API.post('/appointments/bulk', seriesData);
+
 export const getAppointment = (id) => API.get(`/appointments/${id}`);
 
 export const deleteAppointment = (id) => {
   return API.delete(`/appointments/${id}`);
 };
+
+// Free slots per day for a doctor: { doctor, slot_minutes, days: [{ date, free: ['09:00', ...] }] }
+export const getDoctorAvailability = (doctor, from, to) => {
+  return API.get(`/doctors/${encodeURIComponent(doctor)}/availability`, { params: { from, to } });
+};
+
+// Calendar events for a visible range: { events } (mode 'events') or { days } (mode 'days')
+export const getCalendar = (from, to, params = {}) => {
+  return API.get('/calendar', { params: { from, to, ...params } });
+};
+
+// Doctor dashboard summary for one day, in a single request:
+// { date, counts: { total, completed, in_progress, upcoming }, queue, queue_truncated,
+//   next_patient, unread_messages: { total, conversations } }
+export const getDoctorDashboard = (date, params = {}) => {
+  return API.get('/dashboard/doctor', { params: { date, ...params } });
+};
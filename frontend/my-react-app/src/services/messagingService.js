@@ -1,9 +1,11 @@
 // src/services/messagingService.js
 import API from './api';
+import { getAuthToken } from './authService';
 
-export const getMessages = async (partnerId) => {
+// Pass { since_id } to fetch only messages newer than the last one already shown
+export const getMessages = async (partnerId, params = {}) => {
   try {
-    const response = await API.get(`/messages?user_id=${partnerId}`);
+    const response = await API.get('/messages', { params: { user_id: partnerId, ...params } });
     return response.data;
   } catch (error) {
     console.error('Error fetching messages:', error);
@@ -31,6 +33,17 @@ export const getConversationPartners = async () => {
   }
 };
 
+// Unread count and last message preview for every conversation partner
+export const getConversationSummaries = async () => {
+  try {
+    const response = await API.get('/messages/conversations');
+    return response.data;
+  } catch (error) {
+    console.error('Error fetching conversation summaries:', error);
+    throw error;
+  }
+};
+
 export const markMessageAsRead = async (messageId) => {
   try {
     const response = await API.put(`/messages/${messageId}`, { read: true });
@@ -39,4 +52,23 @@ export const markMessageAsRead = async (messageId) => {
     console.error('Error marking message as read:', error);
     throw error;
   }
-};
\ No newline at end of file
+};
+
+// Marks all unread messages from partnerId up to upToId as read in one request
+export const markConversationRead = async (partnerId, upToId) => {
+  try {
+    const response = await API.put('/messages/read', { user_id: partnerId, up_to_id: upToId });
+    return response.data;
+  } catch (error) {
+    console.error('Error marking conversation as read:', error);
+    throw error;
+  }
+};
+
+// Server-sent events stream of new messages to or from the current user.
+// EventSource cannot send headers, so the token goes in the query string.
+export const openMessageStream = (sinceId) => {
+  const params = new URLSearchParams({ jwt: getAuthToken() || '' });
+  if (sinceId) params.append('since_id', sinceId);
+  return new EventSource(`${API.defaults.baseURL}/messages/stream?${params.toString()}`);
+};
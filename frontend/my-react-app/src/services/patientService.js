@@ -1,8 +1,13 @@
 // src/services/patientService.js
 import API from './api';
 
-export const getPatients = () =>
-API.get('/patients', { params: { t: new Date().getTime() } });
+// Returns one page: { patients, next_cursor }. Pass next_cursor back as `cursor` for the next page.
+export const getPatients = (params = {}) =>
+API.get('/patients', { params });
+
+// Ranked type-ahead search over name, email and phone: { patients }
+export const searchPatients = (q, params = {}) =>
+API.get('/patients/search', { params: { q, ...params } });
 
 export const addPatient = (patientData) => API.post('/patients', patientData);
 
@@ -13,8 +18,16 @@ export const deletePatient = (id) => API.delete(`/patients/${id}`);
 export const getPatient = (id) => {
     return API.get(`/patients/${id}`);}
 
+// Patient plus embedded relationships in one request. `include` is a list such as
+// ['appointments', 'records']; records come back one page at a time (records_next_cursor).
+export const getPatientBundle = (id, include, params = {}) =>
+API.get(`/patients/${id}`, { params: { include: include.join(','), ...params } });
+
 // NEW: Function to get patient records
 export const getPatientRecords = (patientId) => API.get(`/patients/${patientId}/records`);
+// One record including the full notes (lists only carry notes_excerpt)
+export const getPatientRecord = (patientId, recordId) =>
+    API.get(`/patients/${patientId}/records/${recordId}`);
 export const addPatientRecord = (patientId, recordData) =>
     API.post(`/patients/${patientId}/records`, recordData);
 export const deletePatientRecord = (patientId, recordId) =>
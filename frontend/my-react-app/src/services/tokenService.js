@@ -32,7 +32,7 @@ export const getUserId = () => {
   if (!token) return null;
   try {
     const decoded = jwtDecode(token);
-    return decoded.sub || decoded.id; // Adjust according to how you store the user id in your token payload.
+    return decoded.user_id ?? null; // Numeric user id carried as an additional claim
   } catch (error) {
     console.error("Failed to decode token:", error);
     return null;